@@ -5,6 +5,7 @@ Sequential dual camera test - checks if cameras interfere with each other
 
 import sys
 import os
+import subprocess
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from lerobot.cameras.opencv.camera_opencv import OpenCVCamera
@@ -49,9 +50,20 @@ def check_usb_bandwidth():
     """Check USB bus information"""
     print(f"\n🔍 USB Camera Information:")
     print("-" * 30)
-    os.system("lsusb | grep -i 'cam\\|video'")
+    # subprocess.run without a shell: no /bin/sh fork, and errors are
+    # visible instead of silently swallowed by the shell
+    try:
+        lsusb = subprocess.run(["lsusb"], capture_output=True, text=True, check=False)
+        for line in lsusb.stdout.splitlines():
+            if "cam" in line.lower() or "video" in line.lower():
+                print(line)
+    except FileNotFoundError:
+        print("  ⚠️  lsusb not available")
     print("")
-    os.system("v4l2-ctl --list-devices")
+    try:
+        subprocess.run(["v4l2-ctl", "--list-devices"], check=False)
+    except FileNotFoundError:
+        print("  ⚠️  v4l2-ctl not available")
 
 def main():
     print("🎥 Sequential Dual Camera Analysis")
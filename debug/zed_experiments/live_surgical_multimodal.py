@@ -17,7 +17,39 @@ class ZEDSurgicalLiveDisplay:
     
     def __init__(self):
         self.camera = None
-        
+        # Preallocated BGR frame the overlay is drawn onto, so the
+        # display loop copies into a reused buffer instead of
+        # allocating a fresh one per frame
+        self._overlay_out = None
+
+        # Direct depth→BGR LUT for the 15-45cm range: JET applied to the
+        # normalization curve once, with everything outside the range
+        # forced to black (matches the old invalid-mask behavior)
+        norm = np.zeros(65536, dtype=np.uint8)
+        rng = np.arange(150, 451)
+        norm[150:451] = ((rng - 150) * 255 // 300).astype(np.uint8)
+        bgr = cv2.applyColorMap(norm.reshape(-1, 1), cv2.COLORMAP_JET).reshape(-1, 3)
+        bgr[:150] = 0
+        bgr[451:] = 0
+        self._depth_bgr_lut = bgr
+
+        # Scratch buffers pooled across frames (allocated on first use)
+        self._depth_f32 = None
+        self._depth_u16 = None
+        self._depth_vis_out = None
+
+        # Static overlay lines rasterized once into a sprite matching
+        # the text ROI; per frame they are blitted instead of paying
+        # three FreeType putText calls (coords are ROI-relative)
+        self._static_text = np.zeros((140, 390, 3), dtype=np.uint8)
+        cv2.putText(self._static_text, "SURGICAL DEPTH METRICS", (10, 25),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+        cv2.putText(self._static_text, "Range: 15-45cm (Ultra-Short)", (10, 50),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+        cv2.putText(self._static_text, "Mode: NEURAL_PLUS (Max Quality)", (10, 130),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+        self._static_mask = self._static_text.any(axis=2, keepdims=True)
+
     def setup_surgical_camera(self):
         """Setup ZED camera for ultra-short surgical range"""
         self.camera = sl.Camera()
@@ -56,26 +88,23 @@ class ZEDSurgicalLiveDisplay:
     
     def create_depth_visualization(self, depth_data):
         """Create color-coded depth visualization for 15-45cm range"""
-        depth_cm = depth_data / 10.0  # Convert mm to cm
-        
-        # Focus on surgical range (15-45cm)
-        depth_vis = np.zeros_like(depth_cm, dtype=np.uint8)
-        
-        # Create mask for valid surgical range
-        valid_mask = (depth_cm >= 15) & (depth_cm <= 45) & ~np.isnan(depth_cm)
-        
-        if np.any(valid_mask):
-            # Normalize depth to 0-255 for surgical range (15cm=0, 45cm=255)
-            normalized = ((depth_cm[valid_mask] - 15) / 30) * 255
-            depth_vis[valid_mask] = normalized.astype(np.uint8)
-        
-        # Apply color map (closer=red, farther=blue)
-        depth_colored = cv2.applyColorMap(depth_vis, cv2.COLORMAP_JET)
-        
-        # Set invalid areas to black
-        depth_colored[~valid_mask] = [0, 0, 0]
-        
-        return depth_colored
+        if self._depth_f32 is None or self._depth_f32.shape != depth_data.shape:
+            self._depth_f32 = np.empty(depth_data.shape, dtype=np.float32)
+            self._depth_u16 = np.empty(depth_data.shape, dtype=np.uint16)
+            self._depth_vis_out = np.empty(depth_data.shape + (3,), dtype=np.uint8)
+
+        # Sanitize into pooled scratch (the SDK view must stay intact),
+        # then quantize to uint16 millimeters; NaN/inf become 0 = invalid
+        np.copyto(self._depth_f32, depth_data, casting='unsafe')
+        np.nan_to_num(self._depth_f32, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        np.clip(self._depth_f32, 0, 65535, out=self._depth_f32)
+        np.copyto(self._depth_u16, self._depth_f32, casting='unsafe')
+
+        # One gather does clamp, validity masking, normalization and the
+        # JET colormap (closer=red, farther=blue, invalid=black)
+        np.take(self._depth_bgr_lut, self._depth_u16, axis=0,
+                out=self._depth_vis_out, mode='clip')
+        return self._depth_vis_out
     
     def create_confidence_visualization(self, confidence_data):
         """Visualize confidence map (0=high confidence, 100=low confidence)"""
@@ -85,48 +114,41 @@ class ZEDSurgicalLiveDisplay:
     
     def add_surgical_overlay(self, image, depth_data):
         """Add surgical information overlay"""
-        # Calculate surgical metrics
-        depth_cm = depth_data / 10.0
-        surgical_mask = (depth_cm >= 15) & (depth_cm <= 45) & ~np.isnan(depth_cm)
-        surgical_pixels = np.sum(surgical_mask)
+        # Calculate surgical metrics with masked single-pass reductions:
+        # inRange rejects NaN and out-of-range in one sweep, and the
+        # masked mean/minMax avoid the boolean-indexed copy entirely
+        surgical_mask = cv2.inRange(depth_data, 150, 450)
+        surgical_pixels = cv2.countNonZero(surgical_mask)
         total_pixels = depth_data.size
         coverage = (surgical_pixels / total_pixels) * 100
-        
+
         if surgical_pixels > 0:
-            surgical_depths = depth_cm[surgical_mask]
-            mean_depth = np.mean(surgical_depths)
-            min_depth = np.min(surgical_depths)
-            max_depth = np.max(surgical_depths)
+            mean_depth = cv2.mean(depth_data, mask=surgical_mask)[0] / 10.0
+            min_mm, max_mm, _, _ = cv2.minMaxLoc(depth_data, mask=surgical_mask)
+            min_depth = min_mm / 10.0
+            max_depth = max_mm / 10.0
         else:
             mean_depth = min_depth = max_depth = 0
         
-        # Create overlay
-        overlay = image.copy()
-        h, w = overlay.shape[:2]
-        
-        # Semi-transparent background for text
-        cv2.rectangle(overlay, (10, 10), (400, 150), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, image, 0.3, 0, image)
-        
-        # Add surgical metrics text
-        cv2.putText(image, "SURGICAL DEPTH METRICS", (20, 35),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
-        
-        cv2.putText(image, f"Range: 15-45cm (Ultra-Short)", (20, 60),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        
+        # Semi-transparent background for text: darken just the text
+        # ROI in place instead of copying and blending the whole frame
+        # (0.3*src == blending a black box at 70% opacity)
+        roi = image[10:150, 10:400]
+        cv2.convertScaleAbs(roi, roi, 0.3, 0)
+
+        # Blit the pre-rendered static lines (title, range, mode) over
+        # the darkened ROI; only the per-frame metrics are rasterized
+        np.copyto(roi, self._static_text, where=self._static_mask)
+
         cv2.putText(image, f"Coverage: {coverage:.1f}%", (20, 80),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-        
+
         cv2.putText(image, f"Mean: {mean_depth:.1f}cm", (20, 100),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        
+
         cv2.putText(image, f"Range: {min_depth:.1f}-{max_depth:.1f}cm", (20, 120),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-        
-        cv2.putText(image, f"Mode: NEURAL_PLUS (Max Quality)", (20, 140),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
-        
+
         return image
     
     def run_live_display(self):
@@ -169,8 +191,12 @@ class ZEDSurgicalLiveDisplay:
                     depth_colored = self.create_depth_visualization(depth_data)
                     confidence_colored = self.create_confidence_visualization(confidence_data)
                     
-                    # Add surgical overlay to left image
-                    left_with_metrics = self.add_surgical_overlay(left_rgb.copy(), depth_data)
+                    # Add surgical overlay to left image (copied into a
+                    # reused buffer; the SDK view must stay untouched)
+                    if self._overlay_out is None:
+                        self._overlay_out = np.empty(left_rgb.shape, dtype=np.uint8)
+                    np.copyto(self._overlay_out, left_rgb)
+                    left_with_metrics = self.add_surgical_overlay(self._overlay_out, depth_data)
                     
                     # Display all views
                     cv2.imshow("Left RGB + Metrics", left_with_metrics)
@@ -10,6 +10,7 @@ Based on ZED SDK 5.0 depth sensing documentation for surgical precision.
 
 import sys
 import pyzed.sl as sl
+import cv2
 import numpy as np
 import time
 
@@ -158,33 +159,39 @@ class ZEDUltraShortRangeCamera:
     
     def get_surgical_depth_analysis(self, depth_map: np.ndarray) -> dict:
         """Comprehensive depth analysis for ultra-short surgical range"""
-        # Convert to centimeters for surgical interpretation
-        depth_cm = depth_map / 10.0
-        
-        # Focus on ultra-short surgical range (15-45cm)
-        surgical_mask = (depth_cm >= 15) & (depth_cm <= 45) & ~np.isnan(depth_cm)
-        surgical_pixels = np.sum(surgical_mask)
+        # Single masked pass for the mask/count/mean/std/min/max family:
+        # inRange rejects NaN and out-of-range pixels in one sweep and
+        # the masked OpenCV reductions avoid a full depth_map/10 copy
+        # plus boolean temporaries (15-45cm ultra-short range, in mm)
+        surgical_mask = cv2.inRange(depth_map, 150, 450)
+        surgical_pixels = cv2.countNonZero(surgical_mask)
         total_pixels = depth_map.size
-        
+
         if surgical_pixels > 0:
-            surgical_depths = depth_cm[surgical_mask]
-            
+            mean_mm, std_mm = cv2.meanStdDev(depth_map, mask=surgical_mask)
+            mean_cm = float(mean_mm[0, 0]) / 10.0
+            std_cm = float(std_mm[0, 0]) / 10.0
+            min_mm, max_mm, _, _ = cv2.minMaxLoc(depth_map, mask=surgical_mask)
+
+            # Median and histogram still need the compacted values
+            surgical_depths = depth_map[surgical_mask.view(bool)] / 10.0
+
             # Detailed surgical statistics
             stats = {
                 'valid_pixels': surgical_pixels,
                 'total_pixels': total_pixels,
                 'coverage_percent': (surgical_pixels / total_pixels) * 100,
-                'mean_depth_cm': np.mean(surgical_depths),
+                'mean_depth_cm': mean_cm,
                 'median_depth_cm': np.median(surgical_depths),
-                'min_depth_cm': np.min(surgical_depths),
-                'max_depth_cm': np.max(surgical_depths),
-                'std_depth_cm': np.std(surgical_depths),
-                'depth_range_cm': np.max(surgical_depths) - np.min(surgical_depths),
-                
+                'min_depth_cm': min_mm / 10.0,
+                'max_depth_cm': max_mm / 10.0,
+                'std_depth_cm': std_cm,
+                'depth_range_cm': (max_mm - min_mm) / 10.0,
+
                 # Surgical precision metrics
-                'precision_mm': np.std(surgical_depths) * 10,  # Convert to mm
+                'precision_mm': std_cm * 10,  # Convert to mm
                 'depth_distribution': np.histogram(surgical_depths, bins=10, range=(10, 45))[0],
-                'working_distance_optimal': 20 <= np.mean(surgical_depths) <= 35,  # Optimal surgical range
+                'working_distance_optimal': 20 <= mean_cm <= 35,  # Optimal surgical range
             }
         else:
             stats = {
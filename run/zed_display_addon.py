@@ -25,9 +25,26 @@ class ZEDDisplayAddon:
     def __init__(self):
         self.zed_camera = None
         self.running = False
-        self.frame_cache = {}
-        self.cache_lock = threading.Lock()
-        
+        # Persistent display canvas, allocated on first use
+        self._canvas = None
+
+        # Precomputed depth→uint8 LUT for the 200-500mm surgical range,
+        # fusing clamp+mask+normalize into a single gather per frame
+        self._depth_lut = np.zeros(65536, dtype=np.uint8)
+        rng = np.arange(200, 501)
+        self._depth_lut[200:501] = ((rng - 200) * 255 // 300).astype(np.uint8)
+
+        # Reused colormap output buffers (zero allocation in steady state)
+        self._depth_bgr = None
+        self._depth_frame = np.empty((480, 640, 3), dtype=np.uint8)
+
+        # Coverage is a full-frame reduction; recompute it on a sampling
+        # cadence and show the cached value in between — at 30 FPS the
+        # overlay only needs to refresh about once a second
+        self._stats_interval = 30
+        self._stats_countdown = 0
+        self._coverage = 0.0
+
         print("🎥 ZED Display Add-on for LeRobot Teleoperation")
         print("=" * 60)
         print("This provides additional ZED camera views alongside your")
@@ -78,10 +95,9 @@ class ZEDDisplayAddon:
             # Process left RGB
             if 'left_rgb' in data:
                 left_frame = data['left_rgb']
-                if left_frame.shape[2] == 4:  # RGBA -> RGB
+                if left_frame.shape[2] == 4:  # BGRA -> BGR
                     left_frame = left_frame[:, :, :3]
-                # Convert RGB to BGR for OpenCV display
-                left_frame = cv2.cvtColor(left_frame, cv2.COLOR_RGB2BGR)
+                # SDK views are already BGR — no conversion needed
                 left_frame = cv2.resize(left_frame, (640, 480))
                 
                 # Add title
@@ -92,10 +108,9 @@ class ZEDDisplayAddon:
             # Process right RGB
             if 'right_rgb' in data:
                 right_frame = data['right_rgb']
-                if right_frame.shape[2] == 4:  # RGBA -> RGB
+                if right_frame.shape[2] == 4:  # BGRA -> BGR
                     right_frame = right_frame[:, :, :3]
-                # Convert RGB to BGR for OpenCV display
-                right_frame = cv2.cvtColor(right_frame, cv2.COLOR_RGB2BGR)
+                # SDK views are already BGR — no conversion needed
                 right_frame = cv2.resize(right_frame, (640, 480))
                 
                 # Add title
@@ -107,30 +122,32 @@ class ZEDDisplayAddon:
             if 'depth' in data:
                 depth_mm = data['depth']
                 
-                # Process depth for surgical range (20-50cm)
-                depth_clamped = np.clip(depth_mm, 200, 500)
-                valid_mask = (depth_mm >= 200) & (depth_mm <= 500) & np.isfinite(depth_mm)
-                
-                depth_normalized = np.zeros_like(depth_clamped, dtype=np.uint8)
-                if np.any(valid_mask):
-                    valid_depths = depth_clamped[valid_mask]
-                    normalized_valid = ((valid_depths - 200) / 300 * 255).astype(np.uint8)
-                    depth_normalized[valid_mask] = normalized_valid
-                
-                # Apply colormap
-                depth_colored = cv2.applyColorMap(depth_normalized, cv2.COLORMAP_JET)
-                depth_frame = cv2.resize(depth_colored, (640, 480))
+                # Process depth for surgical range (20-50cm) in a single
+                # LUT gather (invalid NaN/inf pixels map to 0)
+                depth_u16 = np.nan_to_num(depth_mm, nan=0.0, posinf=0.0, neginf=0.0)
+                depth_u16 = np.clip(depth_u16, 0, 65535).astype(np.uint16)
+                depth_normalized = self._depth_lut[depth_u16]
+
+                # Apply colormap into reused buffers
+                if self._depth_bgr is None or self._depth_bgr.shape[:2] != depth_normalized.shape:
+                    self._depth_bgr = np.empty(depth_normalized.shape + (3,), dtype=np.uint8)
+                cv2.applyColorMap(depth_normalized, cv2.COLORMAP_JET, dst=self._depth_bgr)
+                cv2.resize(self._depth_bgr, (640, 480), dst=self._depth_frame)
+                depth_frame = self._depth_frame
                 
                 # Add title and surgical info
                 cv2.putText(depth_frame, "ZED Depth (20-50cm)", (10, 30), 
                            cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2)
                 
-                # Add depth statistics
-                if np.any(valid_mask):
-                    valid_pixels = np.sum(valid_mask)
-                    total_pixels = depth_mm.size
-                    coverage = (valid_pixels / total_pixels) * 100
-                    cv2.putText(depth_frame, f"Coverage: {coverage:.1f}%", (10, 60), 
+                # Add depth statistics (single inRange pass, NaN-safe),
+                # sampled every _stats_interval frames
+                if self._stats_countdown == 0:
+                    valid_pixels = cv2.countNonZero(cv2.inRange(depth_mm, 200, 500))
+                    self._coverage = (valid_pixels / depth_mm.size) * 100
+                    self._stats_countdown = self._stats_interval
+                self._stats_countdown -= 1
+                if self._coverage > 0:
+                    cv2.putText(depth_frame, f"Coverage: {self._coverage:.1f}%", (10, 60),
                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
                 
                 frames["ZED Depth"] = depth_frame
@@ -148,33 +165,31 @@ class ZEDDisplayAddon:
         if not frames:
             return None
         
-        # Arrange frames in surgical layout
+        # Arrange frames in surgical layout, assembled into a persistent
+        # canvas via slice assignment instead of hstack/vstack allocations
         frame_list = list(frames.values())
-        
+
         if len(frame_list) == 1:
             return frame_list[0]
         elif len(frame_list) == 2:
-            return np.hstack(frame_list)
+            if self._canvas is None or self._canvas.shape != (480, 1280, 3):
+                self._canvas = np.zeros((480, 1280, 3), dtype=np.uint8)
+            self._canvas[:, :640] = frame_list[0]
+            self._canvas[:, 640:] = frame_list[1]
+            return self._canvas
         elif len(frame_list) >= 3:
-            # Surgical layout: Left and Right on top, Depth on bottom
+            # Surgical layout: Left and Right on top, Depth centered on bottom
             if "ZED Left RGB" in frames and "ZED Right RGB" in frames and "ZED Depth" in frames:
-                top_row = np.hstack([frames["ZED Left RGB"], frames["ZED Right RGB"]])
-                depth_frame = frames["ZED Depth"]
-                
-                # Center the depth frame under the stereo pair
-                padding = (top_row.shape[1] - depth_frame.shape[1]) // 2
-                if padding > 0:
-                    pad_left = np.zeros((depth_frame.shape[0], padding, 3), dtype=np.uint8)
-                    pad_right = np.zeros((depth_frame.shape[0], padding, 3), dtype=np.uint8)
-                    bottom_row = np.hstack([pad_left, depth_frame, pad_right])
-                else:
-                    bottom_row = depth_frame
-                
-                return np.vstack([top_row, bottom_row])
+                if self._canvas is None or self._canvas.shape != (960, 1280, 3):
+                    self._canvas = np.zeros((960, 1280, 3), dtype=np.uint8)
+                self._canvas[:480, :640] = frames["ZED Left RGB"]
+                self._canvas[:480, 640:] = frames["ZED Right RGB"]
+                self._canvas[480:, 320:960] = frames["ZED Depth"]
+                return self._canvas
             else:
                 # Fallback arrangement
                 return np.hstack(frame_list[:2]) if len(frame_list) >= 2 else frame_list[0]
-        
+
         return None
     
     def run_display(self):
@@ -223,7 +238,14 @@ class ZEDDisplayAddon:
                     if display_frame is not None:
                         timestamp = time.strftime("%Y%m%d_%H%M%S")
                         filename = f"zed_surgical_view_{timestamp}.png"
-                        cv2.imwrite(filename, display_frame)
+                        # Encode off-thread with fast compression so the
+                        # live view doesn't freeze during the write
+                        threading.Thread(
+                            target=cv2.imwrite,
+                            args=(filename, display_frame.copy()),
+                            kwargs={'params': [cv2.IMWRITE_PNG_COMPRESSION, 1]},
+                            daemon=True
+                        ).start()
                         print(f"📸 Screenshot saved: {filename}")
                 
                 time.sleep(1/30)  # ~30 FPS
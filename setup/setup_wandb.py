@@ -10,14 +10,31 @@ import wandb
 import os
 import sys
 
+def _has_local_credentials() -> bool:
+    """Check for wandb credentials locally without a network round-trip."""
+    if os.environ.get("WANDB_API_KEY"):
+        return True
+    netrc_path = os.path.expanduser("~/.netrc")
+    if os.path.exists(netrc_path):
+        try:
+            with open(netrc_path) as f:
+                return "api.wandb.ai" in f.read()
+        except OSError:
+            pass
+    return False
+
+
 def setup_wandb():
     """Guide user through wandb setup process."""
     print("🤖 LeRobot - Weights & Biases Setup")
     print("=" * 40)
     print()
-    
-    # Check if already logged in
+
+    # Check if already logged in (only hit the API when local
+    # credentials exist, to avoid a pointless network round-trip)
     try:
+        if not _has_local_credentials():
+            raise wandb.errors.CommError("no local wandb credentials")
         api = wandb.Api()
         user = api.user()
         print("✅ You are already logged in to Weights & Biases!")
@@ -9,6 +9,7 @@ through a custom camera factory system.
 import sys
 import os
 import time
+import threading
 import numpy as np
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
@@ -36,6 +37,12 @@ class ZEDVirtualCameraBridge:
         self.camera_type = camera_type
         self.virtual_camera = None
         self.is_open = False
+
+        # Requested V4L2-style buffer depth. The virtual cameras serve
+        # the latest frame directly (no driver queue), which is the
+        # lowest-latency behavior a buffer hint can ask for — but honor
+        # and report the property instead of silently pretending
+        self._buffer_size = 1
         
         # Create appropriate virtual camera
         if camera_type == 'left':
@@ -52,6 +59,11 @@ class ZEDVirtualCameraBridge:
         if self.virtual_camera:
             success = self.virtual_camera.connect()
             self.is_open = success
+            if success:
+                # Shadow read() with the camera's bound method: the
+                # per-frame call then skips this bridge's guard checks
+                # and two attribute lookups entirely
+                self.read = self.virtual_camera.read
             return success
         return False
     
@@ -60,38 +72,48 @@ class ZEDVirtualCameraBridge:
         return self.is_open and self.virtual_camera and self.virtual_camera.isOpened()
     
     def read(self) -> Tuple[bool, Optional[np.ndarray]]:
-        """Read frame (OpenCV compatibility)"""
+        """Read frame (OpenCV compatibility; shadowed while open)"""
         if self.virtual_camera and self.is_open:
             return self.virtual_camera.read()
         return False, None
-    
+
     def release(self):
         """Release camera (OpenCV compatibility)"""
         if self.virtual_camera and self.is_open:
             self.virtual_camera.disconnect()
             self.is_open = False
+            # Drop the bound-method shadow so read() guards again
+            self.__dict__.pop('read', None)
     
     def set(self, prop_id: int, value: Any) -> bool:
         """Set camera property (OpenCV compatibility)"""
+        if prop_id == 38:  # CV_CAP_PROP_BUFFERSIZE
+            self._buffer_size = max(1, int(value))
+            return True
         return True
-    
+
     def get(self, prop_id: int) -> float:
         """Get camera property (OpenCV compatibility)"""
         if prop_id == 3:  # CV_CAP_PROP_FRAME_WIDTH
             return 1280.0
         elif prop_id == 4:  # CV_CAP_PROP_FRAME_HEIGHT
             return 720.0
+        elif prop_id == 38:  # CV_CAP_PROP_BUFFERSIZE
+            return float(self._buffer_size)
         return 0.0
 
 
 # Global camera bridges (for process-level access)
 _camera_bridges = {}
+_bridges_lock = threading.Lock()
 
 def get_zed_camera_bridge(camera_type: str) -> ZEDVirtualCameraBridge:
-    """Get or create camera bridge"""
-    if camera_type not in _camera_bridges:
-        _camera_bridges[camera_type] = ZEDVirtualCameraBridge(camera_type)
-    return _camera_bridges[camera_type]
+    """Get or create camera bridge (thread-safe)"""
+    with _bridges_lock:
+        bridge = _camera_bridges.get(camera_type)
+        if bridge is None:
+            bridge = _camera_bridges[camera_type] = ZEDVirtualCameraBridge(camera_type)
+    return bridge
 
 
 # Mock cv2.VideoCapture for ZED virtual cameras
@@ -115,25 +137,32 @@ class ZEDVideoCaptureWrapper:
     def open(self, index_or_path=None):
         """Open camera"""
         if self.bridge:
-            return self.bridge.open(index_or_path or self.index_or_path)
+            success = self.bridge.open(index_or_path or self.index_or_path)
+            if success:
+                # Collapse wrapper → bridge → camera into one call for
+                # the per-frame path (read is re-resolved after open so
+                # it picks up the bridge's own bound-method shadow)
+                self.read = self.bridge.read
+            return success
         return False
-    
+
     def isOpened(self) -> bool:
         """Check if opened"""
         if self.bridge:
             return self.bridge.isOpened()
         return False
-    
+
     def read(self) -> Tuple[bool, Optional[np.ndarray]]:
-        """Read frame"""
+        """Read frame (shadowed while open)"""
         if self.bridge:
             return self.bridge.read()
         return False, None
-    
+
     def release(self):
         """Release camera"""
         if self.bridge:
             self.bridge.release()
+            self.__dict__.pop('read', None)
     
     def set(self, prop_id: int, value: Any) -> bool:
         """Set property"""
@@ -12,13 +12,21 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from src.cameras.lerobot_zed_multimodal import ZEDMultiModalCamera, ZEDMultiModalConfig
 import importlib
+import threading
 from typing import Dict, Any
 
 
+# Cache cameras per config so repeated config loads reuse connected
+# instances instead of re-initializing the ZED SDK (a multi-second
+# operation); the lock makes the factory safe from concurrent callers
+_factory_lock = threading.Lock()
+_camera_cache: Dict[frozenset, ZEDMultiModalCamera] = {}
+
+
 def create_zed_multimodal_camera(camera_config: Dict[str, Any], camera_index: int = 0) -> ZEDMultiModalCamera:
     """
     Factory function to create ZED multi-modal cameras for LeRobot
-    
+
     Args:
         camera_config: Camera configuration dict with keys:
             - type: 'zed_multimodal'
@@ -26,19 +34,21 @@ def create_zed_multimodal_camera(camera_config: Dict[str, Any], camera_index: in
             - modality: 'depth' or 'pointcloud' (for depth data)
             - width, height, fps: Camera parameters
         camera_index: Camera index (not used for ZED)
-    
+
     Returns:
-        ZEDMultiModalCamera instance
+        ZEDMultiModalCamera instance (shared across identical configs)
     """
     # Remove the 'type' key as it's not needed for the config
     config_dict = {k: v for k, v in camera_config.items() if k != 'type'}
-    
-    # Create configuration
-    config = ZEDMultiModalConfig(**config_dict)
-    
-    # Create camera
-    camera = ZEDMultiModalCamera(config)
-    
+
+    cache_key = frozenset(config_dict.items())
+    with _factory_lock:
+        camera = _camera_cache.get(cache_key)
+        if camera is None:
+            config = ZEDMultiModalConfig(**config_dict)
+            camera = ZEDMultiModalCamera(config)
+            _camera_cache[cache_key] = camera
+
     return camera
 
 
@@ -70,46 +80,24 @@ def parse_camera_config_string(config_string: str) -> Dict[str, Dict[str, Any]]:
     """
     import re
     import ast
-    
+
     try:
-        # Clean up the string and convert to valid Python dict syntax
-        cleaned = config_string.strip()
-        if cleaned.startswith('{ ') and cleaned.endswith(' }'):
-            cleaned = cleaned[2:-2]  # Remove outer braces
-        
-        # Split by camera definitions
-        camera_configs = {}
-        
-        # Use regex to find camera definitions
-        pattern = r'(\w+):\s*\{([^}]+)\}'
-        matches = re.findall(pattern, cleaned)
-        
-        for camera_name, config_str in matches:
-            # Parse individual camera config
-            config = {}
-            
-            # Split by commas and parse key-value pairs
-            for item in config_str.split(','):
-                item = item.strip()
-                if ':' in item:
-                    key, value = item.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes and convert types
-                    if value.startswith('/dev/'):
-                        config[key] = value  # Path string
-                    elif value.isdigit():
-                        config[key] = int(value)  # Integer
-                    elif value.replace('.', '', 1).isdigit():
-                        config[key] = float(value)  # Float
-                    else:
-                        config[key] = value  # String
-            
-            camera_configs[camera_name] = config
-        
+        # Quote every bare identifier/path (leaving already-quoted
+        # strings alone), which turns the whole config into a valid
+        # Python literal that ast.literal_eval parses in one C pass —
+        # no token-by-token splitting or hand-rolled type coercion,
+        # and ints/floats fall out with their native types
+        bare_token = re.compile(r'"[^"]*"|([A-Za-z_/][\w/.\-]*)')
+        quoted = bare_token.sub(
+            lambda m: m.group(0) if m.group(1) is None else f'"{m.group(1)}"',
+            config_string.strip())
+
+        camera_configs = ast.literal_eval(quoted)
+        if not isinstance(camera_configs, dict):
+            raise ValueError(f"Expected a camera mapping, got {type(camera_configs).__name__}")
+
         return camera_configs
-        
+
     except Exception as e:
         print(f"❌ Failed to parse camera config: {e}")
         print(f"   Config string: {config_string}")
@@ -14,10 +14,13 @@ Based on your existing zed_sdk_camera.py and zed_live_viewer.py
 """
 
 import sys
+import os
 import cv2
 import numpy as np
 import time
 import signal
+import struct
+import fcntl
 import threading
 import queue
 import argparse
@@ -36,6 +39,109 @@ except ImportError:
     print("Could not import ZEDSDKCamera. Please check your path.")
 
 
+class _V4L2DirectWriter:
+    """Writes frames straight to a v4l2loopback device fd.
+
+    cv2.VideoWriter routes MJPG output through FFmpeg's muxer, which
+    adds a container layer and its latency. This writer negotiates the
+    pixel format itself and os.write()s each frame:
+
+    - 'bgr24': MJPEG bitstream via cv2.imencode (libjpeg-turbo SIMD,
+      GIL-releasing), with direct control over JPEG quality
+    - 'bgr565': raw 16-bit color, 2 bytes/pixel — ~33% of the bgr24
+      bandwidth, no encode at all
+    - 'gray': raw single channel, 1 byte/pixel
+
+    Exposes the VideoWriter subset the writer loop uses.
+    """
+
+    # VIDIOC_S_FMT = _IOWR('V', 5, struct v4l2_format); the struct is
+    # 208 bytes on the 64-bit ABI, encoded in the ioctl number
+    _VIDIOC_S_FMT = 0xC0D05605
+    _V4L2_BUF_TYPE_VIDEO_OUTPUT = 2
+    _V4L2_FIELD_NONE = 1
+    _V4L2_COLORSPACE_JPEG = 7
+    _V4L2_COLORSPACE_SRGB = 8
+
+    # pixel_format -> (v4l2 fourcc, bytes/pixel: 0 = compressed)
+    _FORMATS = {
+        'bgr24': (0x47504A4D, 0),   # 'MJPG'
+        'bgr565': (0x50424752, 2),  # 'RGBP' (V4L2_PIX_FMT_RGB565)
+        'gray': (0x59455247, 1),    # 'GREY'
+    }
+
+    def __init__(self, device: str, width: int, height: int,
+                 pixel_format: str = 'bgr24', quality: int = 75):
+        if pixel_format not in self._FORMATS:
+            raise ValueError(f"Unknown pixel format: {pixel_format}")
+        self.pixel_format = pixel_format
+        self._encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), int(quality)]
+        self._conv = None  # pooled conversion buffer for raw formats
+
+        pixelformat, bpp = self._FORMATS[pixel_format]
+        if bpp:
+            bytesperline = width * bpp
+            sizeimage = width * height * bpp
+            colorspace = self._V4L2_COLORSPACE_SRGB
+        else:
+            bytesperline = 0                 # compressed: none
+            sizeimage = width * height * 3   # upper bound
+            colorspace = self._V4L2_COLORSPACE_JPEG
+
+        self.fd = os.open(device, os.O_WRONLY)
+
+        # v4l2_format: u32 type, 4 pad bytes, then v4l2_pix_format
+        # (width, height, pixelformat, field, bytesperline, sizeimage,
+        # colorspace, priv, flags, ycbcr_enc, quantization, xfer_func),
+        # padded out to the 200-byte union
+        fmt = struct.pack(
+            '=I4x12I152x',
+            self._V4L2_BUF_TYPE_VIDEO_OUTPUT,
+            width, height,
+            pixelformat,
+            self._V4L2_FIELD_NONE,
+            bytesperline,
+            sizeimage,
+            colorspace,
+            0, 0, 0, 0, 0)
+        try:
+            fcntl.ioctl(self.fd, self._VIDIOC_S_FMT, fmt)
+        except OSError:
+            os.close(self.fd)
+            self.fd = -1
+            raise
+
+    def isOpened(self) -> bool:
+        return self.fd >= 0
+
+    def write(self, frame: np.ndarray) -> bool:
+        if self.pixel_format == 'bgr24':
+            ok, buf = cv2.imencode('.jpg', frame, self._encode_params)
+            if ok:
+                os.write(self.fd, buf)
+            return bool(ok)
+
+        if self.pixel_format == 'gray':
+            if frame.ndim == 2:
+                # Already single channel (e.g. raw normalized depth)
+                os.write(self.fd, frame)
+                return True
+            if self._conv is None or self._conv.shape != frame.shape[:2]:
+                self._conv = np.empty(frame.shape[:2], dtype=np.uint8)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._conv)
+        else:  # bgr565
+            if self._conv is None or self._conv.shape[:2] != frame.shape[:2]:
+                self._conv = np.empty(frame.shape[:2] + (2,), dtype=np.uint8)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2BGR565, dst=self._conv)
+        os.write(self.fd, self._conv)
+        return True
+
+    def release(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
 class ZEDLeRobotBridge:
     """Bridge between ZED SDK camera and LeRobot teleoperation system"""
     
@@ -44,32 +150,125 @@ class ZEDLeRobotBridge:
                  output_width: int = 1280,
                  output_height: int = 720,
                  output_fps: int = 30,
-                 processing_mode: str = "RGB"):
+                 processing_mode: str = "RGB",
+                 pixel_format: str = "bgr24"):
         """
         Initialize the bridge service
-        
+
         Args:
             output_device: v4l2loopback device path
             output_width: Output video width
-            output_height: Output video height  
+            output_height: Output video height
             output_fps: Output frame rate
             processing_mode: RGB, DEPTH, RGBD, or SURGICAL
+            pixel_format: bgr24 (MJPEG-encoded), bgr565, or gray —
+                raw formats skip the JPEG encode and cut bandwidth
         """
         self.output_device = output_device
         self.output_width = output_width
         self.output_height = output_height
         self.output_fps = output_fps
         self.processing_mode = processing_mode
+        self.pixel_format = pixel_format
         
         # Initialize your ZED camera with surgical settings
         self.zed_camera = None
         self.video_writer = None
         self.is_running = False
         
-        # Performance monitoring
+        # Performance monitoring (monotonic clock: immune to NTP steps)
         self.frame_count = 0
-        self.last_time = time.time()
+        self.last_time = time.monotonic()
         self.fps_actual = 0.0
+
+        # Reusable frame buffers, sized lazily on first use so the
+        # 30 Hz processing loop allocates nothing in steady state
+        self._resize_out = None
+        self._depth_f32 = None
+        self._depth_u16 = None
+        self._depth_colored = None
+
+        # Depth→BGR JET table for the 200-500mm surgical range: the
+        # normalization curve pushed through the colormap once, so the
+        # per-frame colorization is a single uint16 gather
+        depth_lut = np.zeros(65536, dtype=np.uint8)
+        rng = np.arange(200, 501)
+        depth_lut[200:501] = ((rng - 200) * 255 // 300).astype(np.uint8)
+        self._depth_bgr_lut = cv2.applyColorMap(
+            depth_lut.reshape(-1, 1), cv2.COLORMAP_JET).reshape(-1, 3)
+        # Pre-colormap normalization curve, for the grayscale output
+        # path where the consumer applies its own mapping
+        self._depth_norm_lut = depth_lut
+        self._depth_gray = None
+
+        # Direct depth→overlay LUT for SURGICAL mode: red fades in and
+        # blue fades out across the 200-500mm range, black elsewhere.
+        # One gather replaces the old mask/copy/normalize/channel-write
+        # cascade over the full frame.
+        overlay_lut = np.zeros((65536, 3), dtype=np.uint8)
+        rng = np.arange(200, 501)
+        norm = (rng - 200) / 300.0
+        overlay_lut[200:501, 2] = (norm * 255).astype(np.uint8)        # Red: close→far
+        overlay_lut[200:501, 0] = ((1 - norm) * 255).astype(np.uint8)  # Blue: far→close
+        self._overlay_lut = overlay_lut
+        self._surgical_f32 = None
+        self._surgical_u16 = None
+        self._depth_overlay = None
+        self._blended = None
+
+        # Fallback frames keyed by message (rendered once, reused)
+        self._fallback_cache = {}
+
+        # Mode dispatch resolved once at construction: the mode never
+        # changes afterwards, so the per-frame path skips the if/elif
+        # string compares entirely
+        self._dispatch = {
+            "RGB": self._process_rgb_mode,
+            "DEPTH": self._process_depth_mode,
+            "RGBD": self._process_rgbd_mode,
+            "SURGICAL": self._process_surgical_mode,
+        }
+        self._process = self._dispatch.get(processing_mode, self._process_rgb_mode)
+
+        # Single-slot hand-off to the writer thread: MJPEG encoding in
+        # VideoWriter.write takes several ms and must not block the next
+        # ZED capture. Newest frame wins; three rotating copies keep the
+        # writer from racing the producer — with only two, the buffer
+        # comes back around while a slow encode may still be reading it.
+        self._write_q = queue.Queue(maxsize=1)
+        self._writer_thread = None
+        self._write_bufs = [None, None, None]
+        self._write_idx = 0
+
+        # Capture runs on its own thread publishing the latest data
+        # under a condition variable, so the blocking SDK grab overlaps
+        # with processing here and encoding on the writer thread —
+        # three pipeline stages on three threads (all GIL-releasing)
+        self._capture_cv = threading.Condition()
+        self._capture_data = None
+        self._capture_seq = 0
+        self._capture_thread = None
+        # Rotating pooled buffer sets the capture thread publishes
+        # into — the SDK views themselves must never cross threads
+        self._capture_bufs = [None, None, None]
+        self._capture_idx = 0
+
+        # Modalities the resolved handler actually consumes; the
+        # capture thread retrieves and snapshots only these
+        self._capture_modalities = {
+            "RGB": ('left_rgb',),
+            "DEPTH": ('depth',),
+            "RGBD": ('left_rgb', 'depth'),
+            "SURGICAL": ('left_rgb', 'depth'),
+        }.get(processing_mode, ('left_rgb',))
+
+        # Distinct cores for the three stages (when the host has them):
+        # pinning keeps each stage's ~2.7 MB frame working set warm in
+        # its own core's cache instead of migrating with the scheduler
+        try:
+            self._stage_cores = sorted(os.sched_getaffinity(0))
+        except (AttributeError, OSError):
+            self._stage_cores = []
         
         # Setup signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -98,18 +297,42 @@ class ZEDLeRobotBridge:
         if not self.zed_camera.connect():
             print("Failed to connect ZED camera")
             return False
-        
-        # Setup video writer with proper codec for v4l2loopback
-        # Use MJPG codec which works well with v4l2loopback and OpenCV
-        fourcc = cv2.VideoWriter_fourcc(*'MJPG')
-        self.video_writer = cv2.VideoWriter(
-            self.output_device,
-            fourcc,
-            self.output_fps,
-            (self.output_width, self.output_height),
-            True  # isColor=True
-        )
-        
+
+        # Let OpenCV's T-API dispatch to OpenCL where a device exists.
+        # The heavy per-frame work here is fused uint16 LUT gathers in
+        # numpy (host-side by design), but resize/addWeighted/encode
+        # route through the dispatcher and pick up the GPU for free.
+        try:
+            if cv2.ocl.haveOpenCL():
+                cv2.ocl.setUseOpenCL(True)
+                print(f"OpenCL enabled: {cv2.ocl.Device_getDefault().name()}")
+        except cv2.error:
+            pass
+
+        # Prefer writing straight to the v4l2 fd; fall back to
+        # cv2.VideoWriter when format negotiation is refused
+        # (non-loopback target, differing kernel ABI, ...)
+        try:
+            self.video_writer = _V4L2DirectWriter(
+                self.output_device, self.output_width, self.output_height,
+                pixel_format=self.pixel_format)
+            print(f"Writing {self.pixel_format} directly to the v4l2 device "
+                  "(no FFmpeg mux)")
+        except OSError as e:
+            if self.pixel_format != "bgr24":
+                # The cv2 fallback only speaks BGR frames through MJPG
+                print(f"Direct v4l2 writer required for {self.pixel_format}: {e}")
+                return False
+            print(f"Direct v4l2 writer unavailable ({e}), using cv2.VideoWriter")
+            fourcc = cv2.VideoWriter_fourcc(*'MJPG')
+            self.video_writer = cv2.VideoWriter(
+                self.output_device,
+                fourcc,
+                self.output_fps,
+                (self.output_width, self.output_height),
+                True  # isColor=True
+            )
+
         if not self.video_writer.isOpened():
             print(f"Failed to open video writer for {self.output_device}")
             print("Make sure v4l2loopback is loaded:")
@@ -129,117 +352,152 @@ class ZEDLeRobotBridge:
         Returns:
             Processed frame ready for LeRobot consumption
         """
-        if self.processing_mode == "RGB":
-            return self._process_rgb_mode(data)
-        elif self.processing_mode == "DEPTH":
-            return self._process_depth_mode(data)
-        elif self.processing_mode == "RGBD":
-            return self._process_rgbd_mode(data)
-        elif self.processing_mode == "SURGICAL":
-            return self._process_surgical_mode(data)
-        else:
-            # Fallback to RGB
-            return self._process_rgb_mode(data)
+        return self._process(data)
     
+    def _resize_to(self, frame: np.ndarray, width: int, height: int) -> np.ndarray:
+        """Resize to the target size, skipping the no-op case.
+
+        INTER_AREA for downscales, INTER_LINEAR for upscales.
+        """
+        if self._resize_out is None or self._resize_out.shape[:2] != (height, width):
+            self._resize_out = np.empty((height, width, 3), dtype=np.uint8)
+        if frame.shape[:2] == (height, width):
+            # Writers need contiguous memory; sliced views are not —
+            # copy into the reused buffer rather than allocating
+            np.copyto(self._resize_out, frame)
+            return self._resize_out
+        downscale = frame.shape[0] > height or frame.shape[1] > width
+        interp = cv2.INTER_AREA if downscale else cv2.INTER_LINEAR
+        cv2.resize(frame, (width, height), dst=self._resize_out, interpolation=interp)
+        return self._resize_out
+
     def _process_rgb_mode(self, data: dict) -> np.ndarray:
         """Process RGB mode - clean left camera feed"""
-        if 'left_rgb' not in data:
+        # dict.get: one hash lookup instead of a membership test
+        # followed by a second lookup
+        frame = data.get('left_rgb')
+        if frame is None:
             return self._create_fallback_frame("No RGB data")
-        
-        frame = data['left_rgb'].copy()
-        
-        # Ensure correct format (BGR for OpenCV/LeRobot)
-        if frame.shape[2] == 4:  # RGBA
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGBA2BGR)
-        elif frame.shape[2] == 3:  # Assume RGB, convert to BGR
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-        
-        # Resize to output dimensions
-        frame = cv2.resize(frame, (self.output_width, self.output_height))
-        
-        return frame
-    
+        if frame.shape[2] == 4:
+            # SDK views are BGRA: the channel slice is already BGR,
+            # no cvtColor pass needed
+            frame = frame[:, :, :3]
+
+        return self._resize_to(frame, self.output_width, self.output_height)
+
+    def _quantize_depth(self, depth_mm: np.ndarray) -> np.ndarray:
+        """Sanitize a depth array into pooled scratch and quantize to
+        uint16 mm; NaN/inf map to 0, outside the colormapped range"""
+        if self._depth_f32 is None or self._depth_f32.shape != depth_mm.shape:
+            self._depth_f32 = np.empty(depth_mm.shape, dtype=np.float32)
+            self._depth_u16 = np.empty(depth_mm.shape, dtype=np.uint16)
+            self._depth_colored = np.empty(depth_mm.shape + (3,), dtype=np.uint8)
+            self._depth_gray = np.empty(depth_mm.shape, dtype=np.uint8)
+
+        np.copyto(self._depth_f32, depth_mm, casting='unsafe')
+        np.nan_to_num(self._depth_f32, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        np.clip(self._depth_f32, 0, 65535, out=self._depth_f32)
+        np.copyto(self._depth_u16, self._depth_f32, casting='unsafe')
+        return self._depth_u16
+
+    def _colorize_depth(self, depth_mm: np.ndarray) -> np.ndarray:
+        """Surgical-range (20-50cm) JET colorization of a depth array"""
+        depth_u16 = self._quantize_depth(depth_mm)
+
+        # One gather does clamp, range masking, normalization and the
+        # JET colormap — no boolean compaction or scatter-back
+        np.take(self._depth_bgr_lut, depth_u16, axis=0,
+                out=self._depth_colored, mode='clip')
+        return self._depth_colored
+
+    def _normalize_depth_gray(self, depth_mm: np.ndarray) -> np.ndarray:
+        """Surgical-range depth normalized to single-channel uint8 —
+        the colormap step skipped entirely for the grayscale output"""
+        depth_u16 = self._quantize_depth(depth_mm)
+        np.take(self._depth_norm_lut, depth_u16,
+                out=self._depth_gray, mode='clip')
+        return self._depth_gray
+
     def _process_depth_mode(self, data: dict) -> np.ndarray:
         """Process depth mode - your surgical depth visualization"""
-        if 'depth' not in data:
+        depth_mm = data.get('depth')
+        if depth_mm is None:
             return self._create_fallback_frame("No depth data")
-        
-        depth_mm = data['depth']
-        
-        # Use your existing surgical depth processing
-        depth_clamped = np.clip(depth_mm, 200, 500)  # 20-50cm surgical range
-        valid_mask = (depth_mm > 200) & (depth_mm < 500) & np.isfinite(depth_mm)
-        
-        depth_normalized = np.zeros_like(depth_clamped, dtype=np.uint8)
-        if np.any(valid_mask):
-            valid_depths = depth_clamped[valid_mask]
-            normalized_valid = ((valid_depths - 200) / (500 - 200) * 255).astype(np.uint8)
-            depth_normalized[valid_mask] = normalized_valid
-        
-        # Apply JET colormap like your viewer
-        depth_colored = cv2.applyColorMap(depth_normalized, cv2.COLORMAP_JET)
-        
-        # Resize to output dimensions
-        depth_colored = cv2.resize(depth_colored, (self.output_width, self.output_height))
-        
-        return depth_colored
-    
+
+        # Resize the raw depth first (NEAREST keeps invalid NaNs intact)
+        # so the colorization pass touches the output-sized buffer only
+        if depth_mm.shape[:2] != (self.output_height, self.output_width):
+            depth_mm = cv2.resize(depth_mm, (self.output_width, self.output_height),
+                                  interpolation=cv2.INTER_NEAREST)
+
+        if self.pixel_format == "gray":
+            # Grayscale output: skip the colormap, publish the
+            # normalized depth directly
+            return self._normalize_depth_gray(depth_mm)
+        return self._colorize_depth(depth_mm)
+
     def _process_rgbd_mode(self, data: dict) -> np.ndarray:
         """Process RGB + Depth side by side"""
-        rgb_frame = self._process_rgb_mode(data)
-        depth_frame = self._process_depth_mode(data)
-        
-        # Resize both to half width
+        left = data.get('left_rgb')
+        depth = data.get('depth')
+        if left is None or depth is None:
+            return self._create_fallback_frame("Missing RGBD data")
+
+        # Resize the raw sources straight to half width — colorizing
+        # after the downscale halves the pixels every later pass touches,
+        # and avoids the old resize-to-full-then-resize-to-half double pass
         half_width = self.output_width // 2
-        rgb_half = cv2.resize(rgb_frame, (half_width, self.output_height))
-        depth_half = cv2.resize(depth_frame, (half_width, self.output_height))
-        
+        if left.shape[2] == 4:
+            left = left[:, :, :3]
+        rgb_half = self._resize_to(left, half_width, self.output_height)
+        depth_small = cv2.resize(depth, (half_width, self.output_height),
+                                 interpolation=cv2.INTER_NEAREST)
+        depth_half = self._colorize_depth(depth_small)
+
         # Combine side by side
-        combined = np.hstack((rgb_half, depth_half))
-        
-        return combined
+        return cv2.hconcat((rgb_half, depth_half))
     
     def _process_surgical_mode(self, data: dict) -> np.ndarray:
         """
         Surgical mode - RGB with depth overlay for surgical applications
         This combines your RGB and depth processing for surgical robotics
         """
-        if 'left_rgb' not in data or 'depth' not in data:
+        rgb_frame = data.get('left_rgb')
+        depth_mm = data.get('depth')
+        if rgb_frame is None or depth_mm is None:
             return self._create_fallback_frame("Missing surgical data")
-        
-        # Get RGB frame
-        rgb_frame = data['left_rgb'].copy()
-        if rgb_frame.shape[2] == 4:  # RGBA
-            rgb_frame = cv2.cvtColor(rgb_frame, cv2.COLOR_RGBA2BGR)
-        elif rgb_frame.shape[2] == 3:  # RGB
-            rgb_frame = cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2BGR)
-        
-        # Get depth data
-        depth_mm = data['depth']
-        
-        # Create depth mask for surgical range (20-50cm)
-        surgical_mask = (depth_mm >= 200) & (depth_mm <= 500) & np.isfinite(depth_mm)
-        
-        # Create depth overlay
-        depth_overlay = np.zeros_like(rgb_frame)
-        if np.any(surgical_mask):
-            # Normalize depth in surgical range
-            depth_surgical = depth_mm.copy()
-            depth_surgical[~surgical_mask] = 0
-            depth_norm = np.clip((depth_surgical - 200) / (500 - 200), 0, 1)
-            
-            # Create colored overlay (red for close, blue for far)
-            depth_overlay[:, :, 2] = (depth_norm * 255 * surgical_mask).astype(np.uint8)  # Red channel
-            depth_overlay[:, :, 0] = ((1 - depth_norm) * 255 * surgical_mask).astype(np.uint8)  # Blue channel
-        
-        # Blend RGB with depth overlay
+
+        # SDK views are BGR-native; slice off alpha
+        if rgb_frame.shape[2] == 4:
+            rgb_frame = rgb_frame[:, :, :3]
+
+        if self._surgical_f32 is None or self._surgical_f32.shape != depth_mm.shape:
+            self._surgical_f32 = np.empty(depth_mm.shape, dtype=np.float32)
+            self._surgical_u16 = np.empty(depth_mm.shape, dtype=np.uint16)
+            self._depth_overlay = np.empty(depth_mm.shape + (3,), dtype=np.uint8)
+            self._blended = np.empty(depth_mm.shape + (3,), dtype=np.uint8)
+
+        # Sanitize into pooled scratch and quantize to uint16 mm
+        # (NaN/inf become 0, which the LUT maps to black)
+        np.copyto(self._surgical_f32, depth_mm, casting='unsafe')
+        np.nan_to_num(self._surgical_f32, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        np.clip(self._surgical_f32, 0, 65535, out=self._surgical_f32)
+        np.copyto(self._surgical_u16, self._surgical_f32, casting='unsafe')
+
+        # One gather builds the red/blue surgical overlay: range mask,
+        # normalization and both channel ramps fused into the LUT
+        np.take(self._overlay_lut, self._surgical_u16, axis=0,
+                out=self._depth_overlay, mode='clip')
+
+        # Blend RGB with depth overlay into the reused output
         alpha = 0.7  # RGB weight
         beta = 0.3   # Depth overlay weight
-        blended = cv2.addWeighted(rgb_frame, alpha, depth_overlay, beta, 0)
-        
-        # Resize to output dimensions
-        blended = cv2.resize(blended, (self.output_width, self.output_height))
+        blended = cv2.addWeighted(rgb_frame, alpha, self._depth_overlay, beta, 0,
+                                  dst=self._blended)
         
+        # Resize to output dimensions (skipped when sizes match)
+        blended = self._resize_to(blended, self.output_width, self.output_height)
+
         # Add surgical information overlay
         cv2.putText(blended, "SURGICAL MODE", (10, 30), 
                    cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 255, 0), 2)
@@ -249,46 +507,157 @@ class ZEDLeRobotBridge:
         return blended
     
     def _create_fallback_frame(self, message: str) -> np.ndarray:
-        """Create a fallback frame when data is missing"""
-        frame = np.zeros((self.output_height, self.output_width, 3), dtype=np.uint8)
-        cv2.putText(frame, message, (50, self.output_height // 2), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+        """Create a fallback frame when data is missing (cached per
+        message — the error path fires exactly when the system is
+        already stressed, so don't pay a zero-fill + putText there)"""
+        frame = self._fallback_cache.get(message)
+        if frame is None:
+            frame = np.zeros((self.output_height, self.output_width, 3), dtype=np.uint8)
+            cv2.putText(frame, message, (50, self.output_height // 2),
+                       cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+            self._fallback_cache[message] = frame
         return frame
     
+    def _pin_stage(self, stage: int):
+        """Pin the calling thread to its stage's core.
+
+        No-op when the host has fewer cores than pipeline stages —
+        pinning would then serialize stages that should overlap.
+        """
+        if len(self._stage_cores) < 3:
+            return
+        try:
+            # pid 0 = the calling thread, not the whole process
+            os.sched_setaffinity(0, {self._stage_cores[stage]})
+        except OSError:
+            pass
+
+    def _snapshot_capture(self, data: dict) -> dict:
+        """Copy SDK views into one of three rotating pooled buffer sets.
+
+        capture_all_modalities returns zero-copy views of the camera's
+        reused sl.Mat storage, and the very next retrieve overwrites
+        them in place — publishing the raw views would tear exactly
+        when processing overlaps capture, the case this pipelining
+        exists for. Three rotating sets give the main loop two full
+        grab periods to finish with a frame before its storage is
+        rewritten.
+        """
+        slot = self._capture_bufs[self._capture_idx]
+        if slot is None:
+            slot = self._capture_bufs[self._capture_idx] = {}
+        self._capture_idx = (self._capture_idx + 1) % 3
+
+        snapshot = {}
+        for key, arr in data.items():
+            buf = slot.get(key)
+            if buf is None or buf.shape != arr.shape or buf.dtype != arr.dtype:
+                buf = slot[key] = np.empty(arr.shape, dtype=arr.dtype)
+            np.copyto(buf, arr)
+            snapshot[key] = buf
+        return snapshot
+
+    def _capture_loop(self):
+        """Pump the ZED SDK, publishing a pooled copy of each capture"""
+        self._pin_stage(1)
+        while self.is_running:
+            data = self.zed_camera.capture_all_modalities(self._capture_modalities)
+            if data:
+                snapshot = self._snapshot_capture(data)
+                with self._capture_cv:
+                    self._capture_data = snapshot
+                    self._capture_seq += 1
+                    self._capture_cv.notify_all()
+            else:
+                time.sleep(0.005)
+
+    def _writer_loop(self):
+        """Drain the frame queue into the v4l2 device (encode off-loop)"""
+        self._pin_stage(2)
+        try:
+            # Protect the v4l2 write cadence from CPU contention when
+            # we have the privilege; harmless to skip when we don't
+            os.nice(-5)
+        except OSError:
+            pass
+        while True:
+            frame = self._write_q.get()
+            if frame is None:
+                break
+            self.video_writer.write(frame)
+
+    def _enqueue_frame(self, frame: np.ndarray):
+        """Hand a frame to the writer thread, replacing any stale one"""
+        buf = self._write_bufs[self._write_idx]
+        if buf is None or buf.shape != frame.shape:
+            buf = self._write_bufs[self._write_idx] = np.empty_like(frame)
+        np.copyto(buf, frame)
+        self._write_idx = (self._write_idx + 1) % 3
+        try:
+            self._write_q.put_nowait(buf)
+        except queue.Full:
+            # Writer is mid-encode on the other buffer: evict the
+            # stale pending frame, the consumer wants the newest
+            try:
+                self._write_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._write_q.put_nowait(buf)
+
     def run(self):
         """Main processing loop"""
         print("Starting ZED to LeRobot Bridge service...")
         print("Press Ctrl+C to stop")
-        
+
         self.is_running = True
-        
+        self._pin_stage(0)
+
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+        self._capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self._capture_thread.start()
+
+        # Monotonic deadline scheduler: sleeping to an advancing deadline
+        # (rather than "period minus this loop's time") keeps the cadence
+        # drift-free over long sessions; resync after an overrun so one
+        # slow frame doesn't spiral
+        period = 1.0 / self.output_fps
+        deadline = time.monotonic() + period
+        last_seq = 0
+
         try:
             while self.is_running:
-                loop_start = time.time()
-                
-                # Capture all modalities using your existing method
-                data = self.zed_camera.capture_all_modalities()
-                
-                if not data:
+                # Wait for a capture newer than the one we last processed
+                with self._capture_cv:
+                    if self._capture_seq == last_seq:
+                        self._capture_cv.wait(timeout=1.0)
+                    data = self._capture_data
+                    seq = self._capture_seq
+
+                if not data or seq == last_seq:
                     print("Warning: No data from ZED camera")
                     time.sleep(0.1)
                     continue
-                
-                # Process frame for LeRobot
-                processed_frame = self.process_frame_for_lerobot(data)
-                
-                # Write to virtual camera
-                self.video_writer.write(processed_frame)
-                
+                last_seq = seq
+
+                # Process frame for LeRobot (pre-bound mode handler)
+                processed_frame = self._process(data)
+
+                # Hand off to the writer thread (never blocks on encode)
+                self._enqueue_frame(processed_frame)
+
                 # Update performance metrics
                 self._update_performance()
-                
-                # Maintain frame rate
-                loop_time = time.time() - loop_start
-                target_time = 1.0 / self.output_fps
-                if loop_time < target_time:
-                    time.sleep(target_time - loop_time)
-                
+
+                # Maintain frame rate against the running deadline
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                    deadline += period
+                else:
+                    deadline = time.monotonic() + period
+
         except KeyboardInterrupt:
             print("Interrupted by user")
         except Exception as e:
@@ -299,7 +668,7 @@ class ZEDLeRobotBridge:
     def _update_performance(self):
         """Update performance monitoring"""
         self.frame_count += 1
-        current_time = time.time()
+        current_time = time.monotonic()
         
         if current_time - self.last_time >= 5.0:  # Report every 5 seconds
             self.fps_actual = self.frame_count / (current_time - self.last_time)
@@ -313,7 +682,24 @@ class ZEDLeRobotBridge:
         print("Stopping ZED to LeRobot Bridge...")
         
         self.is_running = False
-        
+
+        # Let the capture thread observe the stop flag and exit before
+        # the camera disconnects under it
+        if self._capture_thread and self._capture_thread.is_alive():
+            self._capture_thread.join(timeout=2.0)
+
+        # Flush the writer thread before releasing the video writer
+        if self._writer_thread and self._writer_thread.is_alive():
+            try:
+                self._write_q.put_nowait(None)
+            except queue.Full:
+                try:
+                    self._write_q.get_nowait()
+                except queue.Empty:
+                    pass
+                self._write_q.put_nowait(None)
+            self._writer_thread.join(timeout=2.0)
+
         if self.video_writer:
             self.video_writer.release()
             print("Video writer released")
@@ -337,9 +723,14 @@ def main():
                        help="Output video height (default: 720)")
     parser.add_argument("--fps", type=int, default=30, 
                        help="Output frame rate (default: 30)")
-    parser.add_argument("--mode", choices=["RGB", "DEPTH", "RGBD", "SURGICAL"], 
+    parser.add_argument("--mode", choices=["RGB", "DEPTH", "RGBD", "SURGICAL"],
                        default="RGB", help="Processing mode (default: RGB)")
-    
+    parser.add_argument("--pixfmt", choices=["bgr24", "bgr565", "gray"],
+                       default="bgr24",
+                       help="v4l2 output pixel format (default: bgr24, "
+                            "MJPEG-encoded; raw formats skip the encode "
+                            "and cut bandwidth)")
+
     args = parser.parse_args()
     
     if not ZED_SDK_AVAILABLE:
@@ -352,6 +743,7 @@ def main():
     print(f"Resolution: {args.width}x{args.height}")
     print(f"FPS: {args.fps}")
     print(f"Mode: {args.mode}")
+    print(f"Pixel format: {args.pixfmt}")
     print()
     
     # Check if v4l2loopback device exists
@@ -367,7 +759,8 @@ def main():
         output_width=args.width,
         output_height=args.height,
         output_fps=args.fps,
-        processing_mode=args.mode
+        processing_mode=args.mode,
+        pixel_format=args.pixfmt
     )
     
     if not bridge.initialize():
@@ -8,6 +8,8 @@ This allows LeRobot to use our ZED SDK cameras through standard interfaces.
 
 import sys
 import os
+import json
+import functools
 from pathlib import Path
 from typing import Dict, Any
 
@@ -42,6 +44,44 @@ def create_zed_camera(camera_config: Dict[str, Any]) -> Any:
         raise ValueError(f"Unknown ZED camera type: {zed_type}")
 
 
+@functools.lru_cache(maxsize=1)
+def _enum_video_devices() -> tuple:
+    """Enumerate /dev/video* once per session.
+
+    A single scandir pass replaces the per-call glob + per-device stat
+    — camera topology doesn't change mid-session, so LeRobot setup
+    scripts calling the config builder repeatedly shouldn't re-walk
+    /dev every time.
+    """
+    try:
+        with os.scandir('/dev') as entries:
+            return tuple(sorted(f"/dev/{entry.name}" for entry in entries
+                                if entry.name.startswith('video')))
+    except OSError:
+        return ()
+
+
+def _zed_camera_entry(zed_type: str) -> Dict[str, Any]:
+    """Config entry routing a ZED virtual camera through this factory"""
+    return {
+        "type": "python",
+        "module": "src.cameras.zed_lerobot_factory",
+        "class": "create_zed_camera",
+        "config": {"zed_type": zed_type, "width": 1280, "height": 720},
+    }
+
+
+def _wrist_camera_entry(device: str) -> Dict[str, Any]:
+    """Config entry for a plain OpenCV wrist camera"""
+    return {
+        "type": "opencv",
+        "index_or_path": device,
+        "width": 1280,
+        "height": 720,
+        "fps": 30,
+    }
+
+
 def get_five_modality_config() -> str:
     """
     Get camera configuration string for 5-modality surgical robotics:
@@ -55,92 +95,38 @@ def get_five_modality_config() -> str:
         Camera configuration string for LeRobot
     """
     
-    # Check available video devices
-    import glob
-    video_devices = glob.glob('/dev/video*')
-    video_devices.sort()
-    
+    # Check available video devices (cached enumeration)
+    video_devices = _enum_video_devices()
+
     print("📷 Available video devices:")
     for device in video_devices:
         print(f"  {device}")
-    
+
     # Standard wrist camera assignments
     left_wrist = "/dev/video0"  # Typically first device
     right_wrist = "/dev/video2"  # Often the second enumeration
-    
+
     # Check if right wrist is available (since you mentioned it's unplugged)
-    right_wrist_available = os.path.exists(right_wrist)
-    
+    right_wrist_available = right_wrist in video_devices
+
+    # Build the config as a plain dict and serialize: guaranteed-valid
+    # quoting, and json.dumps output parses fine through the existing
+    # string-config consumer
+    config = {
+        "zed_left": _zed_camera_entry("left"),
+        "zed_right": _zed_camera_entry("right"),
+        "zed_depth": _zed_camera_entry("depth"),
+        "left_wrist": _wrist_camera_entry(left_wrist),
+    }
+
     if right_wrist_available:
         print(f"✅ Both wrist cameras detected: {left_wrist}, {right_wrist}")
-        
-        config = f"""{{
-            zed_left: {{
-                type: python,
-                module: src.cameras.zed_lerobot_factory,
-                class: create_zed_camera,
-                config: {{zed_type: left, width: 1280, height: 720}}
-            }},
-            zed_right: {{
-                type: python,
-                module: src.cameras.zed_lerobot_factory,
-                class: create_zed_camera,
-                config: {{zed_type: right, width: 1280, height: 720}}
-            }},
-            zed_depth: {{
-                type: python,
-                module: src.cameras.zed_lerobot_factory,
-                class: create_zed_camera,
-                config: {{zed_type: depth, width: 1280, height: 720}}
-            }},
-            left_wrist: {{
-                type: opencv,
-                index_or_path: {left_wrist},
-                width: 1280,
-                height: 720,
-                fps: 30
-            }},
-            right_wrist: {{
-                type: opencv,
-                index_or_path: {right_wrist},
-                width: 1280,
-                height: 720,
-                fps: 30
-            }}
-        }}"""
+        config["right_wrist"] = _wrist_camera_entry(right_wrist)
     else:
         print(f"⚠️  Right wrist camera not found: {right_wrist}")
         print(f"✅ Using left wrist only: {left_wrist}")
-        
-        config = f"""{{
-            zed_left: {{
-                type: python,
-                module: src.cameras.zed_lerobot_factory,
-                class: create_zed_camera,
-                config: {{zed_type: left, width: 1280, height: 720}}
-            }},
-            zed_right: {{
-                type: python,
-                module: src.cameras.zed_lerobot_factory,
-                class: create_zed_camera,
-                config: {{zed_type: right, width: 1280, height: 720}}
-            }},
-            zed_depth: {{
-                type: python,
-                module: src.cameras.zed_lerobot_factory,
-                class: create_zed_camera,
-                config: {{zed_type: depth, width: 1280, height: 720}}
-            }},
-            left_wrist: {{
-                type: opencv,
-                index_or_path: {left_wrist},
-                width: 1280,
-                height: 720,
-                fps: 30
-            }}
-        }}"""
-    
-    return config.strip()
+
+    return json.dumps(config, indent=4)
 
 
 def test_configuration():
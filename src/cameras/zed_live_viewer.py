@@ -15,6 +15,8 @@ import sys
 import cv2
 import numpy as np
 import time
+import queue
+import threading
 from pathlib import Path
 
 # Add project root to path
@@ -41,7 +43,68 @@ class ZEDLiveViewer:
         
         # Data containers for additional measures
         self.confidence_map = sl.Mat()
-        
+
+        # Bounded background saver: screenshots are encoded off the
+        # display loop so a keypress never freezes the live view
+        self._save_queue = queue.Queue(maxsize=8)
+        self._saver_thread = None
+        # Backpressure metrics: dropped saves and deepest queue seen
+        self._save_drops = 0
+        self._save_high_water = 0
+
+        # Precomputed depth→uint8 LUT for the 200-500mm surgical range
+        # plus reusable scratch buffers, so the per-frame depth display
+        # path runs in place with no temporaries
+        self._depth_lut = np.zeros(65536, dtype=np.uint8)
+        rng = np.arange(200, 501)
+        self._depth_lut[200:501] = ((rng - 200) * 255 // 300).astype(np.uint8)
+        self._depth_f32 = None
+        self._depth_u16 = None
+
+        # Confidence display buffers plus a pre-rendered label layer,
+        # so the per-frame path is scale → colormap → add with no
+        # allocation or FreeType text rasterization
+        self._conf_u8 = None
+        self._conf_colored = None
+        self._conf_text_layer = None
+
+        # Single 2x2 mosaic canvas: one imshow (one texture upload to
+        # the windowing system) per frame instead of four
+        self._mosaic = None
+        self._tile_h = 0
+        self._tile_w = 0
+
+    def _saver_loop(self):
+        """Drain the save queue, JPEG-encoding in the background"""
+        while True:
+            item = self._save_queue.get()
+            if item is None:
+                break
+            filename, frame = item
+            try:
+                cv2.imwrite(filename, frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
+            except Exception as e:
+                print(f"⚠️  Screenshot save failed: {e}")
+
+    def _queue_screenshot(self, filename, frame):
+        """Hand a frame copy to the saver thread.
+
+        Drop-oldest under backpressure: the newest screenshot is the one
+        the operator asked for, so evict the stalest pending write
+        rather than refusing the fresh one.
+        """
+        item = (filename, frame.copy())
+        try:
+            self._save_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self._save_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._save_queue.put_nowait(item)
+            self._save_drops += 1
+        self._save_high_water = max(self._save_high_water, self._save_queue.qsize())
+
     def initialize_camera(self):
         """Initialize ZED camera with surgical settings"""
         print("🔌 Initializing ZED 2i with surgical configuration...")
@@ -65,19 +128,20 @@ class ZEDLiveViewer:
     
     def process_depth_for_display(self, depth_mm):
         """Convert depth to surgical range visualization"""
-        # Clamp to surgical range (20-50cm)
-        depth_clamped = np.clip(depth_mm, 200, 500)
-        
-        # Create mask for valid depths
-        valid_mask = (depth_mm > 200) & (depth_mm < 500) & np.isfinite(depth_mm)
-        
-        # Normalize to 0-255 for display
-        depth_normalized = np.zeros_like(depth_clamped, dtype=np.uint8)
-        if np.any(valid_mask):
-            valid_depths = depth_clamped[valid_mask]
-            normalized_valid = ((valid_depths - 200) / (500 - 200) * 255).astype(np.uint8)
-            depth_normalized[valid_mask] = normalized_valid
-        
+        if self._depth_f32 is None or self._depth_f32.shape != depth_mm.shape:
+            self._depth_f32 = np.empty(depth_mm.shape, dtype=np.float32)
+            self._depth_u16 = np.empty(depth_mm.shape, dtype=np.uint16)
+
+        # Sanitize and clip in place in a reused float32 scratch, then
+        # quantize to uint16 mm; NaN/inf map to 0 = invalid
+        np.copyto(self._depth_f32, depth_mm, casting='unsafe')
+        np.nan_to_num(self._depth_f32, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        np.clip(self._depth_f32, 0, 65535, out=self._depth_f32)
+        np.copyto(self._depth_u16, self._depth_f32, casting='unsafe')
+
+        # Fused clamp+mask+normalize via one LUT gather
+        depth_normalized = self._depth_lut[self._depth_u16]
+
         # Apply colormap for better visualization - JET gives better color range for surgical work
         depth_colored = cv2.applyColorMap(depth_normalized, cv2.COLORMAP_JET)
         
@@ -97,18 +161,25 @@ class ZEDLiveViewer:
         try:
             if self.zed_camera.zed.retrieve_measure(self.confidence_map, sl.MEASURE.CONFIDENCE) == sl.ERROR_CODE.SUCCESS:
                 confidence_np = self.confidence_map.get_data()
-                # Convert to 0-255 range for display
-                confidence_display = (confidence_np * 255).astype(np.uint8)
+
+                if self._conf_u8 is None or self._conf_u8.shape != confidence_np.shape:
+                    self._conf_u8 = np.empty(confidence_np.shape, dtype=np.uint8)
+                    self._conf_colored = np.empty(confidence_np.shape + (3,), dtype=np.uint8)
+                    # Rasterize the static labels once; per frame they
+                    # are composited with a saturating add
+                    self._conf_text_layer = np.zeros_like(self._conf_colored)
+                    cv2.putText(self._conf_text_layer, "Confidence Map", (10, 30),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                    cv2.putText(self._conf_text_layer, "Threshold: 50%", (10, 60),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+
+                # Convert to 0-255 range for display (saturating, in place)
+                cv2.convertScaleAbs(confidence_np, self._conf_u8, 255.0)
                 # Use PLASMA colormap for better confidence visualization
-                confidence_colored = cv2.applyColorMap(confidence_display, cv2.COLORMAP_PLASMA)
-                
-                # Add confidence info
-                cv2.putText(confidence_colored, "Confidence Map", (10, 30), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-                cv2.putText(confidence_colored, "Threshold: 50%", (10, 60), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-                
-                return confidence_colored
+                cv2.applyColorMap(self._conf_u8, cv2.COLORMAP_PLASMA, dst=self._conf_colored)
+                cv2.add(self._conf_colored, self._conf_text_layer, dst=self._conf_colored)
+
+                return self._conf_colored
         except Exception as e:
             print(f"❌ Confidence map error: {e}")
             
@@ -132,14 +203,14 @@ class ZEDLiveViewer:
         return frame
     
     def run_live_viewer(self):
-        """Run the live viewer with separate windows"""
+        """Run the live viewer with a single 2x2 mosaic window"""
         print("🎥 Starting ZED Live Multi-Modal Viewer")
         print("=" * 60)
-        print("📊 You will see 4 separate windows:")
-        print("  📷 ZED Left RGB - Left eye camera view")
-        print("  📷 ZED Right RGB - Right eye camera view") 
-        print("  🔍 ZED Depth - Neural depth map (20-50cm)")
-        print("  🎯 ZED Confidence - Depth confidence map")
+        print("📊 You will see one 2x2 mosaic window:")
+        print("  📷 ZED Left RGB - Left eye camera view (top-left)")
+        print("  📷 ZED Right RGB - Right eye camera view (top-right)")
+        print("  🔍 ZED Depth - Neural depth map, 20-50cm (bottom-left)")
+        print("  🎯 ZED Confidence - Depth confidence map (bottom-right)")
         print("")
         print("🎮 Controls:")
         print("  - Press 'q' in any window to quit")
@@ -149,7 +220,14 @@ class ZEDLiveViewer:
         
         self.is_running = True
         frame_count = 0
-        
+
+        self._saver_thread = threading.Thread(target=self._saver_loop, daemon=True)
+        self._saver_thread.start()
+
+        # Discard anything captured while windows and threads were
+        # being set up — start the loop on the newest camera image
+        self.zed_camera.drain_to_latest()
+
         try:
             while self.is_running:
                 # Capture all modalities
@@ -161,35 +239,46 @@ class ZEDLiveViewer:
                     continue
                 
                 frame_count += 1
-                
-                # Process and display Left RGB
+
+                # Allocate the mosaic canvas once the tile size is known
+                if self._mosaic is None and 'left_rgb' in data:
+                    self._tile_h, self._tile_w = data['left_rgb'].shape[:2]
+                    self._mosaic = np.zeros((self._tile_h * 2, self._tile_w * 2, 3),
+                                            dtype=np.uint8)
+                if self._mosaic is None:
+                    continue
+                h, w = self._tile_h, self._tile_w
+
+                # Compose all modalities into mosaic quadrants; the
+                # frame-info text is drawn directly on the slice views
                 if 'left_rgb' in data:
-                    left_frame = data['left_rgb'].copy()
-                    left_frame = self.add_frame_info(left_frame, "ZED Left RGB", 
-                                                   f"Frame: {frame_count} | 20-50cm Range")
-                    cv2.imshow("ZED Left RGB", left_frame)
-                
-                # Process and display Right RGB  
+                    tile = self._mosaic[:h, :w]
+                    np.copyto(tile, data['left_rgb'])
+                    self.add_frame_info(tile, "ZED Left RGB",
+                                        f"Frame: {frame_count} | 20-50cm Range")
+
                 if 'right_rgb' in data:
-                    right_frame = data['right_rgb'].copy()
-                    right_frame = self.add_frame_info(right_frame, "ZED Right RGB", 
-                                                    f"Frame: {frame_count} | 20-50cm Range")
-                    cv2.imshow("ZED Right RGB", right_frame)
-                
-                # Process and display Depth
+                    tile = self._mosaic[:h, w:]
+                    np.copyto(tile, data['right_rgb'])
+                    self.add_frame_info(tile, "ZED Right RGB",
+                                        f"Frame: {frame_count} | 20-50cm Range")
+
                 if 'depth' in data:
-                    depth_frame = self.process_depth_for_display(data['depth'])
-                    depth_frame = self.add_frame_info(depth_frame, "ZED Depth (NEURAL_PLUS)", 
-                                                    f"Frame: {frame_count} | Surgical Range")
-                    cv2.imshow("ZED Depth", depth_frame)
-                
-                # Get and display Confidence Map
+                    tile = self._mosaic[h:, :w]
+                    np.copyto(tile, self.process_depth_for_display(data['depth']))
+                    self.add_frame_info(tile, "ZED Depth (NEURAL_PLUS)",
+                                        f"Frame: {frame_count} | Surgical Range")
+
                 confidence_frame = self.get_confidence_map()
                 if confidence_frame is not None:
-                    confidence_frame = self.add_frame_info(confidence_frame, "ZED Confidence", 
-                                                         f"Frame: {frame_count} | 50% Threshold")
-                    cv2.imshow("ZED Confidence", confidence_frame)
-                
+                    tile = self._mosaic[h:, w:]
+                    np.copyto(tile, confidence_frame)
+                    self.add_frame_info(tile, "ZED Confidence",
+                                        f"Frame: {frame_count} | 50% Threshold")
+
+                # One window, one texture upload per frame
+                cv2.imshow("ZED Multi-Modal (2x2)", self._mosaic)
+
                 # Handle keyboard input
                 key = cv2.waitKey(1) & 0xFF
                 if key == ord('q') or key == 27:  # 'q' or ESC
@@ -198,14 +287,14 @@ class ZEDLiveViewer:
                 elif key == ord('s'):  # Save screenshots
                     timestamp = time.strftime("%Y%m%d_%H%M%S")
                     if 'left_rgb' in data:
-                        cv2.imwrite(f"zed_left_{timestamp}.png", data['left_rgb'])
+                        self._queue_screenshot(f"zed_left_{timestamp}.jpg", self._mosaic[:h, :w])
                     if 'right_rgb' in data:
-                        cv2.imwrite(f"zed_right_{timestamp}.png", data['right_rgb'])
+                        self._queue_screenshot(f"zed_right_{timestamp}.jpg", self._mosaic[:h, w:])
                     if 'depth' in data:
-                        cv2.imwrite(f"zed_depth_{timestamp}.png", depth_frame)
+                        self._queue_screenshot(f"zed_depth_{timestamp}.jpg", self._mosaic[h:, :w])
                     if confidence_frame is not None:
-                        cv2.imwrite(f"zed_confidence_{timestamp}.png", confidence_frame)
-                    print(f"📸 Screenshots saved with timestamp {timestamp}")
+                        self._queue_screenshot(f"zed_confidence_{timestamp}.jpg", self._mosaic[h:, w:])
+                    print(f"📸 Screenshots queued with timestamp {timestamp}")
                 
                 # Show stats every 30 frames
                 if frame_count % 30 == 0:
@@ -222,6 +311,15 @@ class ZEDLiveViewer:
         """Cleanup resources"""
         print("🧹 Cleaning up...")
         self.is_running = False
+
+        # Flush pending screenshots before tearing down
+        if self._saver_thread and self._saver_thread.is_alive():
+            self._save_queue.put(None)
+            self._saver_thread.join(timeout=2.0)
+        if self._save_drops or self._save_high_water:
+            print(f"📊 Screenshot queue: high water {self._save_high_water}, "
+                  f"dropped {self._save_drops}")
+
         cv2.destroyAllWindows()
         
         if self.zed_camera:
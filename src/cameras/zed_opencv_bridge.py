@@ -32,6 +32,20 @@ class ZEDOpenCVBridge:
     _shared_zed = None
     _shared_lock = threading.Lock()
     _client_count = 0
+
+    # Shared grabber thread: one background capture serves every bridge
+    # instance, so read() is a buffer lookup instead of a full grab
+    _grab_thread = None
+    _grab_stop = None
+    _data_cv = threading.Condition()
+    _latest_data = None
+    # Monotonic id bumped per real capture, so readers can tell a fresh
+    # frame from one they already processed
+    _latest_grab_id = 0
+    # Rotating pooled snapshot sets the grabber publishes into — the
+    # raw SDK views must never leave the capture thread
+    _grab_bufs = [None, None, None]
+    _grab_idx = 0
     
     def __init__(self, modality: str = "rgb_left", width: int = 1280, height: int = 720, fps: int = 30):
         """
@@ -52,6 +66,23 @@ class ZEDOpenCVBridge:
         # FPS control
         self.frame_interval = 1.0 / fps
         self.last_frame_time = 0
+
+        # Whether the SDK output needs resizing to the requested size;
+        # decided once on the first frame (the SDK size is fixed)
+        self._needs_resize = None
+
+        # Per-tick memoization: if the shared grab id hasn't advanced
+        # since our last read, return the already-processed frame
+        # instead of re-running the modality pipeline on the same data
+        self._last_seen_grab_id = -1
+        self._last_frame = None
+
+        # Precomputed depth→uint8 LUT for the 200-500mm surgical range.
+        # Indexing by uint16 millimeters fuses clamp, validity mask and
+        # normalization into one gather; out-of-range/invalid pixels → 0.
+        self._depth_lut = np.zeros(65536, dtype=np.uint8)
+        rng = np.arange(200, 501)
+        self._depth_lut[200:501] = ((rng - 200) * 255 // 300).astype(np.uint8)
         
         print(f"🎥 ZED OpenCV Bridge ({modality}) initialized")
     
@@ -59,17 +90,27 @@ class ZEDOpenCVBridge:
         """Open camera (OpenCV VideoCapture compatibility)"""
         try:
             with self._shared_lock:
-                if self._shared_zed is None:
-                    self._shared_zed = ZEDSDKCamera(
+                # Assign on the class, not the instance: an instance
+                # attribute would shadow the shared camera and every
+                # bridge would silently open its own
+                if ZEDOpenCVBridge._shared_zed is None:
+                    zed = ZEDSDKCamera(
                         resolution="HD720",
                         depth_mode="NEURAL_PLUS",
                         fps=30
                     )
-                    if not self._shared_zed.connect():
+                    if not zed.connect():
                         return False
+                    ZEDOpenCVBridge._shared_zed = zed
                     print("✅ Shared ZED camera connected")
-                
-                self._client_count += 1
+
+                if ZEDOpenCVBridge._grab_thread is None:
+                    ZEDOpenCVBridge._grab_stop = threading.Event()
+                    ZEDOpenCVBridge._grab_thread = threading.Thread(
+                        target=ZEDOpenCVBridge._grab_loop, daemon=True)
+                    ZEDOpenCVBridge._grab_thread.start()
+
+                ZEDOpenCVBridge._client_count += 1
             
             self._is_opened = True
             print(f"✅ ZED Bridge ({self.modality}) opened")
@@ -79,6 +120,52 @@ class ZEDOpenCVBridge:
             print(f"❌ ZED Bridge ({self.modality}) failed to open: {e}")
             return False
     
+    @classmethod
+    def _snapshot_capture(cls, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy SDK views into one of three rotating pooled buffer sets.
+
+        capture_all_modalities returns zero-copy views of the shared
+        camera's sl.Mat storage, and the next background retrieve
+        overwrites that storage in place — publishing the raw views
+        would let any read landing near the next grab tear mid-copy.
+        Three rotating sets give readers two full grab periods with a
+        stable frame.
+        """
+        slot = cls._grab_bufs[cls._grab_idx]
+        if slot is None:
+            slot = cls._grab_bufs[cls._grab_idx] = {}
+        cls._grab_idx = (cls._grab_idx + 1) % 3
+
+        snapshot = {}
+        for key, arr in data.items():
+            buf = slot.get(key)
+            if buf is None or buf.shape != arr.shape or buf.dtype != arr.dtype:
+                buf = slot[key] = np.empty(arr.shape, dtype=arr.dtype)
+            np.copyto(buf, arr)
+            snapshot[key] = buf
+        return snapshot
+
+    # Modalities the bridge pipelines consume; the point cloud is
+    # never used, so don't retrieve (or snapshot) it
+    _GRAB_MODALITIES = ('left_rgb', 'right_rgb', 'depth')
+
+    @classmethod
+    def _grab_loop(cls):
+        """Background capture loop shared by all bridge instances"""
+        while not cls._grab_stop.is_set():
+            zed = cls._shared_zed
+            if zed is None:
+                break
+            data = zed.capture_all_modalities(cls._GRAB_MODALITIES)
+            if data:
+                snapshot = cls._snapshot_capture(data)
+                with cls._data_cv:
+                    cls._latest_data = snapshot
+                    cls._latest_grab_id += 1
+                    cls._data_cv.notify_all()
+            else:
+                time.sleep(0.005)
+
     def isOpened(self) -> bool:
         """Check if camera is opened (OpenCV compatibility)"""
         return self._is_opened
@@ -104,14 +191,26 @@ class ZEDOpenCVBridge:
         self.last_frame_time = time.time()
         
         try:
-            # Capture from ZED
-            data = self._shared_zed.capture_all_modalities()
+            # Take the grabber thread's latest capture; never fall back
+            # to a blocking grab here — N clients share one capture cost
+            with self._data_cv:
+                if self._latest_data is None:
+                    self._data_cv.wait(timeout=1.0)
+                data = self._latest_data
+                grab_id = self._latest_grab_id
             if not data:
                 return False, None
-            
+
+            # Same capture tick as last time: the processed frame is
+            # still valid, skip the modality pipeline entirely
+            if grab_id == self._last_seen_grab_id and self._last_frame is not None:
+                return True, self._last_frame
+
             # Process based on modality
             frame = self._process_frame(data)
             if frame is not None:
+                self._last_seen_grab_id = grab_id
+                self._last_frame = frame
                 return True, frame
             else:
                 return False, None
@@ -121,43 +220,46 @@ class ZEDOpenCVBridge:
             return False, None
     
     def _process_frame(self, data: Dict[str, Any]) -> Optional[np.ndarray]:
-        """Process frame based on modality"""
+        """Process frame based on modality.
+
+        The arrays in data are the grabber's pooled snapshots (stable
+        for two grab periods), not live SDK views, so the eye paths
+        can hand them out without another copy.
+        """
         import cv2
-        
+
         if self.modality == "rgb_left":
             if 'left_rgb' not in data:
                 return None
             frame = data['left_rgb']
-            if frame.shape[2] == 4:  # RGBA -> RGB
+            if frame.shape[2] == 4:  # BGRA -> BGR
                 frame = frame[:, :, :3]
-            # Convert RGB to BGR for OpenCV
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-            
+            # SDK views are already BGR — no conversion needed for OpenCV
+
         elif self.modality == "rgb_right":
             if 'right_rgb' not in data:
                 return None
             frame = data['right_rgb']
-            if frame.shape[2] == 4:  # RGBA -> RGB
+            if frame.shape[2] == 4:  # BGRA -> BGR
                 frame = frame[:, :, :3]
-            # Convert RGB to BGR for OpenCV
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-            
+            # SDK views are already BGR — no conversion needed for OpenCV
+
+
         elif self.modality == "depth":
             if 'depth' not in data:
                 return None
             
             depth_mm = data['depth']
-            
-            # Process depth for surgical range (20-50cm)
-            depth_clamped = np.clip(depth_mm, 200, 500)
-            valid_mask = (depth_mm >= 200) & (depth_mm <= 500) & np.isfinite(depth_mm)
-            
-            depth_normalized = np.zeros_like(depth_clamped, dtype=np.uint8)
-            if np.any(valid_mask):
-                valid_depths = depth_clamped[valid_mask]
-                normalized_valid = ((valid_depths - 200) / 300 * 255).astype(np.uint8)
-                depth_normalized[valid_mask] = normalized_valid
-            
+
+            # Quantize depth (mm) to uint16; NaN/inf become 0 = invalid.
+            # Millimeter precision is all the surgical range (20-50cm)
+            # needs, and uint16 halves the per-pixel traffic vs float32.
+            depth_u16 = np.nan_to_num(depth_mm, nan=0.0, posinf=0.0, neginf=0.0)
+            depth_u16 = np.clip(depth_u16, 0, 65535).astype(np.uint16)
+
+            # Fused clamp+mask+normalize via one LUT gather
+            depth_normalized = self._depth_lut[depth_u16]
+
             # Apply colormap and convert to BGR for OpenCV
             frame = cv2.applyColorMap(depth_normalized, cv2.COLORMAP_JET)
             
@@ -168,34 +270,51 @@ class ZEDOpenCVBridge:
             left = data['left_rgb'][:, :, :3] if data['left_rgb'].shape[2] == 4 else data['left_rgb']
             right = data['right_rgb'][:, :, :3] if data['right_rgb'].shape[2] == 4 else data['right_rgb']
             
-            # Resize each eye to half width
+            # Resize each eye to half width (SDK views are already BGR)
             eye_width = self.width // 2
             left_resized = cv2.resize(left, (eye_width, self.height))
             right_resized = cv2.resize(right, (eye_width, self.height))
-            
-            # Convert to BGR and combine
-            left_bgr = cv2.cvtColor(left_resized, cv2.COLOR_RGB2BGR)
-            right_bgr = cv2.cvtColor(right_resized, cv2.COLOR_RGB2BGR)
-            frame = np.hstack([left_bgr, right_bgr])
+            frame = np.hstack([left_resized, right_resized])
             
         else:
             return None
         
-        # Resize if needed
-        if frame.shape[:2] != (self.height, self.width):
-            frame = cv2.resize(frame, (self.width, self.height))
-        
+        # Resize if needed (checked once, then branch-free per frame)
+        if self._needs_resize is None:
+            self._needs_resize = frame.shape[:2] != (self.height, self.width)
+            if self._needs_resize:
+                # INTER_AREA for downscale, INTER_LINEAR for upscale
+                downscale = frame.shape[0] > self.height or frame.shape[1] > self.width
+                self._resize_interp = cv2.INTER_AREA if downscale else cv2.INTER_LINEAR
+                # Offload the resize to OpenCL when a device is present,
+                # freeing CPU cycles for capture; probed once per bridge
+                self._use_opencl = cv2.ocl.haveOpenCL()
+        if self._needs_resize:
+            if self._use_opencl:
+                frame = cv2.resize(cv2.UMat(frame), (self.width, self.height),
+                                   interpolation=self._resize_interp).get()
+            else:
+                frame = cv2.resize(frame, (self.width, self.height),
+                                   interpolation=self._resize_interp)
+
         return frame
     
     def release(self) -> None:
         """Release camera (OpenCV compatibility)"""
         if self._is_opened:
             with self._shared_lock:
-                self._client_count -= 1
+                ZEDOpenCVBridge._client_count -= 1
                 if self._client_count <= 0 and self._shared_zed:
-                    self._shared_zed.disconnect()
-                    self._shared_zed = None
-                    self._client_count = 0
+                    # Stop the grabber before closing the camera under it
+                    if ZEDOpenCVBridge._grab_stop is not None:
+                        ZEDOpenCVBridge._grab_stop.set()
+                    if ZEDOpenCVBridge._grab_thread is not None:
+                        ZEDOpenCVBridge._grab_thread.join(timeout=2.0)
+                        ZEDOpenCVBridge._grab_thread = None
+                    ZEDOpenCVBridge._latest_data = None
+                    ZEDOpenCVBridge._shared_zed.disconnect()
+                    ZEDOpenCVBridge._shared_zed = None
+                    ZEDOpenCVBridge._client_count = 0
                     print("🔌 Shared ZED camera released")
             
             self._is_opened = False
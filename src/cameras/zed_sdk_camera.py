@@ -132,53 +132,86 @@ class ZEDSDKCamera:
             self.is_connected = False
             print("✅ ZED SDK Camera disconnected")
     
-    def capture_all_modalities(self) -> Dict[str, Any]:
+    # All modalities this camera can retrieve per grab
+    ALL_MODALITIES = ('left_rgb', 'right_rgb', 'depth', 'point_cloud')
+
+    def capture_all_modalities(self, modalities=None) -> Dict[str, Any]:
         """
         Capture all modalities from ZED camera
-        
+
+        Args:
+            modalities: Optional iterable of modality names to retrieve.
+                Defaults to all modalities. Skipping unused modalities
+                avoids the corresponding SDK retrievals and copies.
+
         Returns:
-            Dictionary with all camera modalities:
-            - 'left_rgb': Left eye RGB image (HxWx3)
-            - 'right_rgb': Right eye RGB image (HxWx3)  
+            Dictionary with the requested camera modalities:
+            - 'left_rgb': Left eye image (HxWx3, SDK-native BGR order)
+            - 'right_rgb': Right eye image (HxWx3, SDK-native BGR order)
             - 'depth': Depth map in millimeters (HxW)
             - 'point_cloud': 3D points with colors (HxWx4: X,Y,Z,RGBA)
+
+        Note: sl.VIEW.LEFT/RIGHT come off the SDK as BGRA, so the image
+        views are BGR — OpenCV consumers can use them directly with no
+        conversion; flip with frame[..., ::-1] only where RGB is needed.
         """
         if not self.is_connected:
             return {}
-        
+
+        wanted = set(modalities) if modalities is not None else set(self.ALL_MODALITIES)
+
         # Grab frame from ZED
         if self.zed.grab(self.runtime_params) != sl.ERROR_CODE.SUCCESS:
             return {}
-        
+
         results = {}
-        
+
         try:
-            # Retrieve left RGB image
-            if self.zed.retrieve_image(self.left_image, sl.VIEW.LEFT) == sl.ERROR_CODE.SUCCESS:
-                left_np = self.left_image.get_data()[:, :, :3]  # Remove alpha channel
-                results['left_rgb'] = left_np
-            
-            # Retrieve right RGB image  
-            if self.zed.retrieve_image(self.right_image, sl.VIEW.RIGHT) == sl.ERROR_CODE.SUCCESS:
-                right_np = self.right_image.get_data()[:, :, :3]  # Remove alpha channel
-                results['right_rgb'] = right_np
-            
+            # Retrieve left RGB image (get_data returns a view, no deep copy)
+            if 'left_rgb' in wanted:
+                if self.zed.retrieve_image(self.left_image, sl.VIEW.LEFT) == sl.ERROR_CODE.SUCCESS:
+                    left_np = self.left_image.get_data()[:, :, :3]  # Remove alpha channel
+                    results['left_rgb'] = left_np
+
+            # Retrieve right RGB image
+            if 'right_rgb' in wanted:
+                if self.zed.retrieve_image(self.right_image, sl.VIEW.RIGHT) == sl.ERROR_CODE.SUCCESS:
+                    right_np = self.right_image.get_data()[:, :, :3]  # Remove alpha channel
+                    results['right_rgb'] = right_np
+
             # Retrieve depth map
-            if self.zed.retrieve_measure(self.depth_map, sl.MEASURE.DEPTH) == sl.ERROR_CODE.SUCCESS:
-                depth_np = self.depth_map.get_data()
-                results['depth'] = depth_np
-            
+            if 'depth' in wanted:
+                if self.zed.retrieve_measure(self.depth_map, sl.MEASURE.DEPTH) == sl.ERROR_CODE.SUCCESS:
+                    depth_np = self.depth_map.get_data()
+                    results['depth'] = depth_np
+
             # Retrieve point cloud (XYZRGBA)
-            if self.zed.retrieve_measure(self.point_cloud, sl.MEASURE.XYZRGBA) == sl.ERROR_CODE.SUCCESS:
-                pointcloud_np = self.point_cloud.get_data()
-                results['point_cloud'] = pointcloud_np
-                
+            if 'point_cloud' in wanted:
+                if self.zed.retrieve_measure(self.point_cloud, sl.MEASURE.XYZRGBA) == sl.ERROR_CODE.SUCCESS:
+                    pointcloud_np = self.point_cloud.get_data()
+                    results['point_cloud'] = pointcloud_np
+
         except Exception as e:
             print(f"❌ Capture error: {e}")
             return {}
-        
+
         return results
-    
+
+    def drain_to_latest(self) -> bool:
+        """Synchronize to the camera's newest image after a stall.
+
+        The SDK holds a single internal image slot — grab() always
+        syncs to the most recent capture rather than replaying a queue
+        — so one successful grab is enough to discard anything stale
+        (e.g. frames taken while a consumer was blocked in setup).
+
+        Returns:
+            True when a fresh frame was grabbed
+        """
+        if not self.is_connected:
+            return False
+        return self.zed.grab(self.runtime_params) == sl.ERROR_CODE.SUCCESS
+
     def get_camera_info(self) -> Dict[str, Any]:
         """Get camera information"""
         if not self.is_connected:
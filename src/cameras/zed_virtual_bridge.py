@@ -11,8 +11,10 @@ Uses v4l2loopback to create virtual video devices that LeRobot can read.
 
 import sys
 import os
+import fcntl
 import subprocess
 import threading
+import concurrent.futures
 import time
 import signal
 import numpy as np
@@ -32,6 +34,32 @@ class ZEDVirtualBridge:
         self.zed_camera = None
         self.is_running = False
         self.processes = {}
+
+        # SPSC ring buffer decoupling ZED capture from the pipe writers.
+        # Plain int head/tail counters are safe for a single producer and
+        # single consumer under the GIL; slots are preallocated on first
+        # frame so the steady state allocates nothing.
+        self._ring_size = 4
+        self._ring = None
+        self._ring_head = 0
+        self._depth_bgr = None
+        # One tail per stream: each pipe has its own feeder thread so
+        # back-pressure on one v4l2 device can't stall the other
+        self._ring_tails = {'left_rgb': 0, 'depth': 0}
+        # Producer signals new frames here so feeders wake immediately
+        # instead of polling on a sleep
+        self._ring_cv = threading.Condition()
+
+        # Frame counter read by the reporter thread; a plain int is
+        # atomic to read under the GIL, so the hot loop never prints
+        self._frame_count = 0
+        # Frames dropped because the slowest feeder had not caught up
+        self._drop_count = 0
+        # Per-stream frames actually written to FFmpeg, plus an EWMA of
+        # capture→write latency (seconds) fed from per-slot timestamps
+        self._write_counts = {'left_rgb': 0, 'depth': 0}
+        self._latency_ewma = {'left_rgb': 0.0, 'depth': 0.0}
+        self._slot_times = [0.0] * self._ring_size
         
         # Virtual device mapping
         self.devices = {
@@ -39,20 +67,71 @@ class ZEDVirtualBridge:
             'depth': '/dev/video21'
         }
         
+        # Precomputed depth→uint8 LUT for the 200-500mm surgical range.
+        # Collapses the per-pixel normalize+clamp+mask into a single gather.
+        depth_lut = np.zeros(65536, dtype=np.uint8)
+        rng = np.arange(200, 501)
+        depth_lut[200:501] = ((rng - 200) * 255 // 300).astype(np.uint8)
+        # Push the normalization curve through the JET colormap once:
+        # the per-frame path is then a single uint16→BGR gather with no
+        # intermediate uint8 plane or applyColorMap call
+        self._depth_bgr_lut = cv2.applyColorMap(
+            depth_lut.reshape(-1, 1), cv2.COLORMAP_JET).reshape(-1, 3)
+
+        # Scratch buffers for depth processing, pooled across frames so
+        # the 30 Hz path allocates nothing (sized on first frame)
+        self._depth_f32 = None
+        self._depth_u16 = None
+
+        # Expected v4l2loopback card labels (used to detect existing devices)
+        self.device_labels = {
+            'left_rgb': 'ZED_Left_RGB',
+            'depth': 'ZED_Depth'
+        }
+
         print("🌉 ZED Virtual Bridge initialized")
         print(f"   ZED Left RGB → {self.devices['left_rgb']}")
         print(f"   ZED Depth    → {self.devices['depth']}")
-    
+
+    def _devices_already_configured(self) -> bool:
+        """Check if virtual devices already exist with the expected card labels"""
+        for name, device in self.devices.items():
+            if not os.path.exists(device):
+                return False
+            sysfs_name = f"/sys/class/video4linux/{os.path.basename(device)}/name"
+            try:
+                with open(sysfs_name) as f:
+                    if f.read().strip() != self.device_labels[name]:
+                        return False
+            except OSError:
+                return False
+        return True
+
+    def _wait_for_devices(self, timeout: float = 3.0) -> bool:
+        """Poll for virtual devices to appear (50ms interval)"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if all(os.path.exists(device) for device in self.devices.values()):
+                return True
+            time.sleep(0.05)
+        return all(os.path.exists(device) for device in self.devices.values())
+
     def create_virtual_devices(self):
         """Create virtual video devices using v4l2loopback"""
+        # Skip the modprobe cycle entirely if devices are already configured
+        if self._devices_already_configured():
+            print("✅ Virtual devices already configured, reusing them")
+            for name, device in self.devices.items():
+                print(f"✅ {device} ready for {name}")
+            return True
+
         print("🔧 Creating virtual video devices...")
-        
+
         # Remove existing modules and recreate with specific device numbers
         try:
-            subprocess.run(['sudo', 'modprobe', '-r', 'v4l2loopback'], 
+            subprocess.run(['sudo', 'modprobe', '-r', 'v4l2loopback'],
                           capture_output=True, check=False)
-            time.sleep(1)
-            
+
             # Create 2 virtual devices at video20 and video21
             cmd = [
                 'sudo', 'modprobe', 'v4l2loopback',
@@ -61,13 +140,14 @@ class ZEDVirtualBridge:
                 'card_label=ZED_Left_RGB,ZED_Depth',
                 'exclusive_caps=1,1'
             ]
-            
+
             result = subprocess.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
                 print(f"⚠️  Warning creating virtual devices: {result.stderr}")
-            
-            time.sleep(2)  # Wait for devices to be created
-            
+
+            # Poll for devices instead of a fixed sleep
+            self._wait_for_devices()
+
             # Verify devices exist
             for name, device in self.devices.items():
                 if os.path.exists(device):
@@ -75,9 +155,9 @@ class ZEDVirtualBridge:
                 else:
                     print(f"❌ {device} not found for {name}")
                     return False
-            
+
             return True
-            
+
         except subprocess.CalledProcessError as e:
             print(f"❌ Failed to create virtual devices: {e}")
             return False
@@ -99,123 +179,233 @@ class ZEDVirtualBridge:
         print("✅ ZED camera connected (20-50cm surgical range)")
         return True
     
-    def process_depth_for_streaming(self, depth_mm):
+    def process_depth_for_streaming(self, depth_mm, dst=None):
         """Convert depth to colorized format suitable for video streaming"""
-        # Clamp to surgical range (20-50cm)
-        depth_clamped = np.clip(depth_mm, 200, 500)
-        
-        # Create mask for valid depths
-        valid_mask = (depth_mm > 200) & (depth_mm < 500) & np.isfinite(depth_mm)
-        
-        # Normalize to 0-255 for display
-        depth_normalized = np.zeros_like(depth_clamped, dtype=np.uint8)
-        if np.any(valid_mask):
-            valid_depths = depth_clamped[valid_mask]
-            normalized_valid = ((valid_depths - 200) / (500 - 200) * 255).astype(np.uint8)
-            depth_normalized[valid_mask] = normalized_valid
-        
-        # Apply JET colormap for streaming
-        depth_colored = cv2.applyColorMap(depth_normalized, cv2.COLORMAP_JET)
-        
-        return depth_colored
+        if self._depth_f32 is None or self._depth_f32.shape != depth_mm.shape:
+            self._depth_f32 = np.empty(depth_mm.shape, dtype=np.float32)
+            self._depth_u16 = np.empty(depth_mm.shape, dtype=np.uint16)
+
+        # Sanitize and clip in place in reused scratch (the SDK view must
+        # stay intact), then quantize to uint16 mm; NaN/inf map to 0
+        np.copyto(self._depth_f32, depth_mm, casting='unsafe')
+        np.nan_to_num(self._depth_f32, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        np.clip(self._depth_f32, 0, 65535, out=self._depth_f32)
+        np.copyto(self._depth_u16, self._depth_f32, casting='unsafe')
+
+        # One gather does clamp, mask, normalization and the JET
+        # colormap in a single pass over the frame
+        if dst is not None:
+            np.take(self._depth_bgr_lut, self._depth_u16, axis=0,
+                    out=dst, mode='clip')
+            return dst
+        return np.take(self._depth_bgr_lut, self._depth_u16, axis=0, mode='clip')
     
-    def start_ffmpeg_streams(self):
-        """Start FFmpeg processes to stream to virtual devices"""
-        print("🚀 Starting FFmpeg streams...")
-        
-        # FFmpeg command for left RGB
-        left_cmd = [
+    def _build_ffmpeg_cmd(self, device: str):
+        """Build the rawvideo→v4l2 FFmpeg command for a virtual device.
+
+        Both streams share the same persistent conversion setup; only the
+        output device differs.
+        """
+        return [
             'ffmpeg',
+            # Low-latency input: don't buffer raw frames before processing
+            '-fflags', 'nobuffer',
+            '-flags', 'low_delay',
             '-f', 'rawvideo',
-            '-pix_fmt', 'bgr24',
+            # Frames arrive pre-converted to planar YUV 4:2:0: half the
+            # pipe bandwidth of bgr24 (1.5 vs 3 bytes/pixel)
+            '-pix_fmt', 'yuv420p',
             '-s', '1280x720',
             '-r', '30',
             '-i', 'pipe:0',
+            # Let the yuv420p→yuyv422 repack use all cores
+            '-threads', '0',
+            '-filter_threads', '0',
             '-f', 'v4l2',
             '-pix_fmt', 'yuyv422',
-            self.devices['left_rgb']
+            device
         ]
-        
-        # FFmpeg command for depth
-        depth_cmd = [
-            'ffmpeg',
-            '-f', 'rawvideo',
-            '-pix_fmt', 'bgr24',
-            '-s', '1280x720', 
-            '-r', '30',
-            '-i', 'pipe:0',
-            '-f', 'v4l2',
-            '-pix_fmt', 'yuyv422',
-            self.devices['depth']
-        ]
-        
+
+    def start_ffmpeg_streams(self):
+        """Start FFmpeg processes to stream to virtual devices"""
+        print("🚀 Starting FFmpeg streams...")
+
         try:
-            # Start FFmpeg processes
-            self.processes['left_rgb'] = subprocess.Popen(
-                left_cmd, stdin=subprocess.PIPE, stderr=subprocess.DEVNULL
-            )
-            print(f"✅ FFmpeg started for left RGB → {self.devices['left_rgb']}")
-            
-            self.processes['depth'] = subprocess.Popen(
-                depth_cmd, stdin=subprocess.PIPE, stderr=subprocess.DEVNULL
-            )
-            print(f"✅ FFmpeg started for depth → {self.devices['depth']}")
-            
+            # Start one persistent FFmpeg process per stream
+            for name in ('left_rgb', 'depth'):
+                # bufsize=0 keeps stdin a raw fd: each frame write is a
+                # single syscall from the numpy buffer, no extra copy
+                self.processes[name] = subprocess.Popen(
+                    self._build_ffmpeg_cmd(self.devices[name]),
+                    stdin=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                    bufsize=0
+                )
+                # Grow the pipe to hold one full I420 frame (1.4 MB at
+                # 720p): the kernel default of 64 KiB makes each frame
+                # write block ~20 times waiting for FFmpeg to drain
+                try:
+                    fcntl.fcntl(self.processes[name].stdin.fileno(),
+                                getattr(fcntl, 'F_SETPIPE_SZ', 1031),
+                                2 * 1024 * 1024)
+                except OSError:
+                    # Over fs.pipe-max-size without privilege; the
+                    # default capacity still works, just with more wakeups
+                    pass
+                print(f"✅ FFmpeg started for {name} → {self.devices[name]}")
+
             return True
-            
+
         except Exception as e:
             print(f"❌ Failed to start FFmpeg: {e}")
             return False
     
+    def _ensure_ring(self, frame_shape):
+        """Preallocate ring slots once the frame shape is known.
+
+        Slots hold planar I420 frames (H*3/2 × W), already in FFmpeg's
+        input format so the pipe carries 1.5 bytes/pixel instead of 3.
+        """
+        if self._ring is None:
+            h, w = frame_shape[:2]
+            i420_shape = (h * 3 // 2, w)
+            self._ring = [
+                {'left_rgb': np.empty(i420_shape, dtype=np.uint8),
+                 'depth': np.empty(i420_shape, dtype=np.uint8)}
+                for _ in range(self._ring_size)
+            ]
+            # Scratch buffer for the colorized depth before YUV packing
+            self._depth_bgr = np.empty((h, w, 3), dtype=np.uint8)
+
     def streaming_loop(self):
-        """Main streaming loop"""
+        """Capture loop (producer): ZED → ring buffer"""
         print("🎥 Starting ZED streaming loop...")
-        frame_count = 0
-        
+
+        # Bind hot-loop names once: attribute and method lookups are
+        # re-resolved every iteration otherwise, and this loop runs at
+        # 30 Hz alongside the two feeder threads
+        capture = self.zed_camera.capture_all_modalities
+        process_depth = self.process_depth_for_streaming
+        ring_size = self._ring_size
+        ring_tails = self._ring_tails
+        monotonic = time.monotonic
+        sleep = time.sleep
+
+        # Monotonic deadline scheduler: sleep only the residual so
+        # capture/convert time doesn't eat into the frame budget
+        period = 1.0 / 30
+        next_t = monotonic() + period
+
         try:
             while self.is_running:
-                # Capture from ZED
-                data = self.zed_camera.capture_all_modalities()
-                
-                if not data:
-                    time.sleep(0.01)
+                # Capture from ZED (only the modalities we actually stream)
+                data = capture(('left_rgb', 'depth'))
+
+                if not data or 'left_rgb' not in data or 'depth' not in data:
+                    sleep(0.01)
                     continue
-                
-                frame_count += 1
-                
-                # Stream left RGB
-                if 'left_rgb' in data and 'left_rgb' in self.processes:
-                    try:
-                        left_frame = data['left_rgb']
-                        # Convert RGB to BGR for FFmpeg
-                        left_bgr = cv2.cvtColor(left_frame, cv2.COLOR_RGB2BGR)
-                        self.processes['left_rgb'].stdin.write(left_bgr.tobytes())
-                        self.processes['left_rgb'].stdin.flush()
-                    except Exception as e:
-                        print(f"⚠️  Left RGB streaming error: {e}")
-                
-                # Stream depth
-                if 'depth' in data and 'depth' in self.processes:
-                    try:
-                        depth_colored = self.process_depth_for_streaming(data['depth'])
-                        self.processes['depth'].stdin.write(depth_colored.tobytes())
-                        self.processes['depth'].stdin.flush()
-                    except Exception as e:
-                        print(f"⚠️  Depth streaming error: {e}")
-                
-                # Show stats every 30 frames
-                if frame_count % 30 == 0:
-                    print(f"📊 Streaming frame {frame_count} | ZED → virtual devices")
-                
-                time.sleep(1/30)  # ~30 FPS
-                
+
+                self._frame_count += 1
+
+                left_frame = data['left_rgb']
+                self._ensure_ring(left_frame.shape)
+
+                if self._ring_head - min(ring_tails.values()) < ring_size:
+                    # Convert straight to I420 in the next free slot so
+                    # FFmpeg only repacks, never color-converts
+                    slot = self._ring[self._ring_head % ring_size]
+                    # SDK views are BGR-native, so pack directly
+                    cv2.cvtColor(left_frame, cv2.COLOR_BGR2YUV_I420, dst=slot['left_rgb'])
+                    process_depth(data['depth'], dst=self._depth_bgr)
+                    cv2.cvtColor(self._depth_bgr, cv2.COLOR_BGR2YUV_I420, dst=slot['depth'])
+                    self._slot_times[self._ring_head % ring_size] = monotonic()
+                    self._ring_head += 1
+                    with self._ring_cv:
+                        self._ring_cv.notify_all()
+                else:
+                    # Feeder is behind: drop this frame, keep capturing
+                    self._drop_count += 1
+
+                # Pace against the deadline; reset on overrun to avoid
+                # spiraling when a frame takes longer than the period
+                delay = next_t - monotonic()
+                if delay > 0:
+                    sleep(delay)
+                    next_t += period
+                else:
+                    next_t = monotonic() + period
+
         except KeyboardInterrupt:
             print("\\n🛑 Interrupted by user")
         except Exception as e:
             print(f"❌ Streaming error: {e}")
         finally:
             self.cleanup()
-    
+
+    def feeder_loop(self, name):
+        """Feeder loop (consumer): ring buffer → one FFmpeg pipe"""
+        # Specialize the loop for this stream: the pipe write and loop
+        # constants are bound once instead of re-resolved per frame
+        process = self.processes.get(name)
+        if process is None:
+            return
+        write = process.stdin.write
+        ring_size = self._ring_size
+        tails = self._ring_tails
+
+        while self.is_running:
+            tail = tails[name]
+            if self._ring is None or tail >= self._ring_head:
+                # Block until the producer publishes a frame (bounded
+                # wait so shutdown is never missed); sub-ms wakeup vs
+                # sleep-polling, and no scheduler churn while idle
+                with self._ring_cv:
+                    if tail >= self._ring_head:
+                        self._ring_cv.wait(timeout=0.1)
+                continue
+
+            slot = self._ring[tail % ring_size]
+            produced_at = self._slot_times[tail % ring_size]
+
+            try:
+                # Write straight from the numpy buffer (no tobytes copy)
+                write(slot[name].data)
+                self._write_counts[name] += 1
+                # EWMA (α=0.1) of capture→write latency for the reporter
+                latency = time.monotonic() - produced_at
+                self._latency_ewma[name] += 0.1 * (latency - self._latency_ewma[name])
+            except Exception as e:
+                print(f"⚠️  {name} streaming error: {e}")
+
+            tails[name] = tail + 1
+
+    def reporter_loop(self):
+        """Reporter loop: print streaming stats once per second.
+
+        Keeps stdout I/O (and the GIL stall it implies) out of the
+        capture and feeder loops entirely.
+        """
+        last_count = 0
+        last_drops = 0
+        # Deadline pacing so the report cadence doesn't drift by the
+        # print time each second
+        deadline = time.monotonic()
+        while self.is_running:
+            deadline += 1.0
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            count = self._frame_count
+            drops = self._drop_count
+            fps = count - last_count
+            last_count = count
+            if count:
+                lat_ms = max(self._latency_ewma.values()) * 1000.0
+                writes = min(self._write_counts.values())
+                line = (f"📊 Streaming frame {count} ({fps} FPS, "
+                        f"{writes} written, {lat_ms:.1f}ms latency) | ZED → virtual devices")
+                if drops != last_drops:
+                    line += f" | ⚠️ dropped {drops - last_drops} (total {drops})"
+                    last_drops = drops
+                print(line)
+
     def start(self):
         """Start the bridge"""
         print("🌉 Starting ZED Virtual Bridge...")
@@ -235,11 +425,23 @@ class ZEDVirtualBridge:
         # Start streaming
         self.is_running = True
         
-        # Run in background thread
+        # Run capture and pipe feeding in separate background threads so
+        # FFmpeg back-pressure can't stall the ZED capture
         self.streaming_thread = threading.Thread(target=self.streaming_loop)
         self.streaming_thread.daemon = True
         self.streaming_thread.start()
-        
+
+        self.feeder_threads = {}
+        for name in ('left_rgb', 'depth'):
+            thread = threading.Thread(target=self.feeder_loop, args=(name,))
+            thread.daemon = True
+            thread.start()
+            self.feeder_threads[name] = thread
+
+        self.reporter_thread = threading.Thread(target=self.reporter_loop)
+        self.reporter_thread.daemon = True
+        self.reporter_thread.start()
+
         print("✅ ZED Virtual Bridge running!")
         print("🎯 Virtual devices created:")
         print(f"   {self.devices['left_rgb']} - ZED Left RGB")
@@ -248,21 +450,29 @@ class ZEDVirtualBridge:
         
         return True
     
+    def _stop_ffmpeg(self, name, process):
+        """Stop one FFmpeg process (terminate, then bounded wait)"""
+        try:
+            if process and process.poll() is None:
+                process.stdin.close()
+                process.terminate()
+                process.wait(timeout=5)
+                print(f"✅ FFmpeg stopped for {name}")
+        except Exception as e:
+            print(f"⚠️  Error stopping {name}: {e}")
+
     def cleanup(self):
         """Cleanup resources"""
         print("🧹 Cleaning up ZED Virtual Bridge...")
         self.is_running = False
-        
-        # Close FFmpeg processes
-        for name, process in self.processes.items():
-            try:
-                if process and process.poll() is None:
-                    process.stdin.close()
-                    process.terminate()
-                    process.wait(timeout=5)
-                    print(f"✅ FFmpeg stopped for {name}")
-            except Exception as e:
-                print(f"⚠️  Error stopping {name}: {e}")
+
+        # Close FFmpeg processes concurrently: each stop can block up to
+        # 5s on wait(), so serial teardown multiplies by stream count
+        if self.processes:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(self.processes)) as executor:
+                for name, process in self.processes.items():
+                    executor.submit(self._stop_ffmpeg, name, process)
         
         # Disconnect ZED
         if self.zed_camera:
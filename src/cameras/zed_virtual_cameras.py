@@ -265,30 +265,39 @@ class ZEDDepthCamera(ZEDVirtualCamera):
     
     def __init__(self, width: int = 1280, height: int = 720, fps: int = 30):
         super().__init__("depth", width, height, fps)
-    
+
+        # Precomputed depth→BGR LUT for the 200-500mm surgical range.
+        # The normalization LUT is pushed through the colormap once at
+        # init, so per frame a single gather maps uint16 depth straight
+        # to the colorized frame; invalid pixels (NaN/inf, out of range)
+        # map to the colormap's zero entry.
+        depth_lut = np.zeros(65536, dtype=np.uint8)
+        rng = np.arange(200, 501)
+        depth_lut[200:501] = ((rng - 200) * 255 // 300).astype(np.uint8)
+        self._depth_bgr_lut = cv2.applyColorMap(
+            depth_lut.reshape(-1, 1), cv2.COLORMAP_VIRIDIS).reshape(-1, 3)
+
+        # Scratch buffers reused across read() calls so the steady
+        # state allocates nothing (allocated on first frame)
+        self._depth_u16 = None
+        self._frame_out = None
+
     def _process_frame(self, frame: np.ndarray) -> np.ndarray:
         """Process depth frame for visualization"""
-        # Convert depth to uint8 for display
-        # Depth is in mm, convert to 0-255 range for visualization
-        depth_mm = frame.astype(np.float32)
-        
-        # Handle invalid depth values (NaN, inf)
-        valid_mask = np.isfinite(depth_mm) & (depth_mm > 0)
-        
-        # Clamp to surgical range (200mm to 500mm = 20cm to 50cm)
-        depth_clamped = np.clip(depth_mm, 200, 500)
-        
-        # Only process valid depths
-        depth_normalized = np.zeros_like(depth_clamped, dtype=np.uint8)
-        if np.any(valid_mask):
-            valid_depths = depth_clamped[valid_mask]
-            normalized_valid = ((valid_depths - 200) / (500 - 200) * 255).astype(np.uint8)
-            depth_normalized[valid_mask] = normalized_valid
-        
-        # Convert to 3-channel for compatibility
-        depth_rgb = cv2.applyColorMap(depth_normalized, cv2.COLORMAP_VIRIDIS)
-        
-        return depth_rgb
+        if self._depth_u16 is None or self._depth_u16.shape != frame.shape:
+            self._depth_u16 = np.empty(frame.shape, dtype=np.uint16)
+            self._frame_out = np.empty(frame.shape + (3,), dtype=np.uint8)
+
+        # Quantize depth (mm) to uint16 in place; the frame is already
+        # our private copy from the manager. NaN/inf become 0 = invalid.
+        np.nan_to_num(frame, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        np.clip(frame, 0, 65535, out=frame)
+        np.copyto(self._depth_u16, frame, casting='unsafe')
+
+        # Fused clamp+normalize+colormap in one LUT gather
+        np.take(self._depth_bgr_lut, self._depth_u16, axis=0,
+                out=self._frame_out, mode='clip')
+        return self._frame_out
 
 
 def test_zed_virtual_cameras():
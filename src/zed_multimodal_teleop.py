@@ -151,7 +151,8 @@ class ZEDMultiModalTeleoperation:
             frames['zed_right'] = right_frame
         
         # ZED depth and pointcloud
-        stereo_result = self.zed_processor.capture_stereo_frame()
+        # Only the eyes are needed here; skip building the combined frame
+        stereo_result = self.zed_processor.capture_stereo_frame(include_combined=False)
         if stereo_result is not None:
             left_eye, right_eye, combined = stereo_result
             depth_map = self.zed_processor.compute_depth_map(left_eye, right_eye)